@@ -0,0 +1,52 @@
+import pytest
+import os
+from utils.benchmark import BenchmarkHistory, BenchmarkRunner, check_regression
+from utils.config_loader import load_config, set_overrides, snapshot_overrides, restore_overrides
+
+@pytest.fixture(scope="session")
+def config(local_app):
+    """Benchmarks always run headless, traced and unhighlighted against the local app"""
+    previous_overrides = snapshot_overrides()
+    set_overrides({
+        'browser': {'headless': True},
+        'debug': {'highlight': 'off'},
+        'tracing': {'enabled': True}
+    })
+    yield load_config()
+    restore_overrides(previous_overrides)
+
+@pytest.fixture(scope="session")
+def benchmark_history(config):
+    """Fixture to provide the benchmark history; this run's results are appended at session end"""
+    benchmark_config = config['benchmarks']
+    history = BenchmarkHistory(
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), benchmark_config['history_path']),
+        baseline_runs=benchmark_config['baseline_runs']
+    )
+    yield history
+    history.flush()
+
+@pytest.fixture(scope="function")
+def bench(config, driver, command_tracer, benchmark_history):
+    """Fixture to measure an operation and fail when it regresses past the configured limits"""
+    benchmark_config = config['benchmarks']
+    runner = BenchmarkRunner(
+        command_tracer,
+        iterations=benchmark_config['iterations'],
+        warmup=benchmark_config['warmup']
+    )
+
+    def measure(name, operation, setup=None):
+        result = runner.run(name, operation, setup)
+        problems = check_regression(
+            name,
+            result,
+            benchmark_history.baseline(name),
+            benchmark_config.get('thresholds', {}),
+            benchmark_config['max_regression']
+        )
+        benchmark_history.record(name, result, problems)
+        assert not problems, "; ".join(problems)
+        return result
+
+    return measure
@@ -0,0 +1,56 @@
+import pytest
+from pages.login_page import LoginPage
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.flaky(reruns=0)]
+
+
+class TestBasePageBenchmarks:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, driver, config):
+        self.config = config
+        self.login_page = LoginPage(driver)
+        self.login_page.navigate_to()
+        assert self.login_page.is_login_page_displayed(), "Login page is not displayed"
+
+    def test_find_element(self, bench):
+        bench("find_element", lambda: self.login_page.find_element(LoginPage.EMAIL_INPUT))
+
+    def test_send_keys(self, bench):
+        bench("send_keys", lambda: self.login_page.send_keys(LoginPage.EMAIL_INPUT, "bench@example.com"))
+
+    def test_click_element(self, bench):
+        bench("click_element", lambda: self.login_page.click_element(LoginPage.REMEMBER_ME_CHECKBOX))
+
+    def test_get_text(self, bench):
+        bench("get_text", lambda: self.login_page.get_text(LoginPage.EMAIL_LABEL))
+
+    def test_is_element_visible(self, bench):
+        bench("is_element_visible", lambda: self.login_page.is_element_visible(LoginPage.LOGIN_BUTTON))
+
+    def test_login(self, bench):
+        invalid_user = self.config['test_data']['invalid_user']
+        bench(
+            "login",
+            lambda: self.login_page.login(invalid_user['email'], invalid_user['password']),
+            setup=self.login_page.navigate_to
+        )
+
+    @pytest.mark.parametrize("wait_mode", ["polling", "observer"])
+    def test_wait_for_error_message(self, bench, wait_mode):
+        invalid_user = self.config['test_data']['invalid_user']
+
+        def submit_invalid_login():
+            self.login_page.navigate_to()
+            # Going to the same #/login URL keeps the last iteration's error in the DOM
+            self.login_page.reload()
+            self.login_page.send_keys(LoginPage.EMAIL_INPUT, invalid_user['email'])
+            self.login_page.send_keys(LoginPage.PASSWORD_INPUT, invalid_user['password'])
+            self.login_page.click_element(LoginPage.LOGIN_BUTTON)
+
+        self.login_page.wait_mode = wait_mode
+        bench(
+            f"wait_for_error_message[{wait_mode}]",
+            lambda: self.login_page.find_element(LoginPage.ERROR_MESSAGE),
+            setup=submit_invalid_login
+        )
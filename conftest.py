@@ -1,87 +1,456 @@
+import time
+from utils.startup import StartupProfile
+
+startup_profile = StartupProfile(time.perf_counter())
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-import yaml
 import os
+import uuid
 import logging
-from datetime import datetime
-
-def load_config():
-    """Load configuration from config.yaml"""
-    config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
-
-def setup_logging():
-    """Setup logging configuration"""
-    log_dir = os.path.join(os.path.dirname(__file__), 'reports', 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    log_file = os.path.join(log_dir, f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getLogger(__name__)
+from local_app.server import LocalLoginApp
+from pages.login_api import LoginApi
+from pages.login_page import LoginPage
+from utils.artifacts import ArtifactWriter
+from utils.auth_state import AuthStateCache
+from utils.browser_contexts import BrowserContexts
+from utils.config_loader import load_config, set_overrides, snapshot_overrides, restore_overrides
+from utils.db_pool import close_pools
+from utils.db_utils import DatabaseUtils
+from utils.driver_pool import DriverPool
+from utils.logging_setup import configure_logging, shutdown_logging
+from utils.network_profile import NetworkProfiles, NetworkUsage
+from utils.resource_monitor import ResourceMonitor
+from utils.test_data import shard_file
+from utils.test_history import TestHistory
+from utils.tracing import CommandTracer
+
+startup_profile.mark('conftest_import')
+
+test_history_key = pytest.StashKey()
+worker_startup_key = pytest.StashKey()
+
+def pytest_configure(config):
+    """Configure logging and the test history store once per process (and per xdist worker)"""
+    settings = load_config()
+    configure_logging(settings.get('logging', {}), os.path.dirname(__file__))
+
+    # Set before xdist spawns workers so every worker records under the same run id
+    run_id = os.environ.setdefault('TEST_HISTORY_RUN_ID', uuid.uuid4().hex)
+    retry_config = settings['retries']
+    history_needed = retry_config.get('enabled', True) or settings['scheduling'].get('enabled', False)
+    if history_needed and not config.option.collectonly:
+        config.stash[test_history_key] = TestHistory(
+            os.path.join(os.path.dirname(__file__), retry_config['history_path']),
+            run_id,
+            os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        )
+    config.stash[worker_startup_key] = []
+    startup_profile.mark('configure')
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """Hook to time collection and write this process's startup report"""
+    with startup_profile.phase('collection'):
+        yield
+    startup_profile.collected(len(session.items))
+    startup_config = load_config().get('startup', {})
+    if startup_config.get('report', True):
+        startup_profile.write(os.path.join(os.path.dirname(__file__), startup_config.get('path', 'reports/startup')))
+
+def pytest_testnodedown(node, error):
+    """Collect the startup report an xdist worker sends back when it finishes"""
+    startup = getattr(node, 'workeroutput', {}).get('startup')
+    if startup:
+        node.config.stash[worker_startup_key].append(startup)
+
+def pytest_unconfigure(config):
+    """Flush queued log records"""
+    shutdown_logging()
+
+def pytest_collection_modifyitems(config, items):
+    """Record fixture groups for the scheduler and spend reruns only on flaky tests or transient errors"""
+    settings = load_config()
+    history = config.stash.get(test_history_key, None)
+    # Every worker collects the same items; one of them stores the groups before the controller schedules
+    if history and settings['scheduling'].get('enabled', False) and os.environ.get('PYTEST_XDIST_WORKER') == 'gw0':
+        from utils.scheduling import fixture_group
+        groups = {item.nodeid: fixture_group(item) for item in items}
+        history.record_groups({nodeid: group for nodeid, group in groups.items() if group})
+
+    retry_config = settings['retries']
+    if not retry_config.get('enabled', True):
+        return
+    flaky = history.flaky_tests(retry_config['history_window']) if history else set()
+
+    for item in items:
+        if item.get_closest_marker('flaky'):
+            continue
+        rerun = {'reruns': retry_config['reruns'], 'reruns_delay': retry_config['reruns_delay']}
+        if item.nodeid not in flaky:
+            rerun['only_rerun'] = list(retry_config['transient_errors'])
+        item.add_marker(pytest.mark.flaky(**rerun))
 
 @pytest.fixture(scope="session")
-def config():
+def config(request):
     """Fixture to provide configuration"""
+    if load_config()['urls'].get('target') == 'local':
+        request.getfixturevalue('local_app')
     return load_config()
 
+@pytest.fixture(scope="session")
+def local_app():
+    """Fixture to start the bundled login app on localhost and point the URLs at it"""
+    config = load_config()
+    app_config = config.get('local_app', {})
+    users = {
+        config['test_data'][key]['email']: config['test_data'][key]['password']
+        for key in app_config.get('users', [])
+    }
+    app = LocalLoginApp(
+        users,
+        host=app_config.get('host', '127.0.0.1'),
+        port=app_config.get('port', 0),
+        latency_ms=app_config.get('latency_ms', 0)
+    ).start()
+    previous_overrides = snapshot_overrides()
+    set_overrides({'urls': {
+        'base_url': app.base_url,
+        'login_url': app.login_url,
+        'dashboard_url': app.dashboard_url
+    }})
+    yield app
+    restore_overrides(previous_overrides)
+    app.stop()
+
 @pytest.fixture(scope="session")
 def logger():
     """Fixture to provide logger"""
-    return setup_logging()
+    return logging.getLogger(__name__)
 
-@pytest.fixture(scope="function")
-def driver(config):
-    """Fixture to provide WebDriver instance"""
+def create_driver(config):
+    """Start and configure a new Chrome instance"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
     chrome_options = Options()
+    chrome_options.page_load_strategy = config['browser'].get('page_load_strategy', 'normal')
     if config['browser']['headless']:
         chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
-    
+    logging_prefs = {'browser': 'ALL'}
+    if config['network'].get('report', False):
+        logging_prefs['performance'] = 'ALL'
+    chrome_options.set_capability('goog:loggingPrefs', logging_prefs)
+
     try:
         # Initialize Chrome driver with direct path
         driver = webdriver.Chrome(options=chrome_options)
         driver.implicitly_wait(config['browser']['implicit_wait'])
         driver.maximize_window()
-        
-        yield driver
+        return driver
     except Exception as e:
         logging.error(f"Failed to initialize Chrome driver: {str(e)}")
         raise
-    finally:
-        try:
-            if 'driver' in locals() and driver:
+
+def attach_driver(config, debugger_address):
+    """Start a WebDriver session on an already running Chrome"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    chrome_options = Options()
+    chrome_options.page_load_strategy = config['browser'].get('page_load_strategy', 'normal')
+    chrome_options.debugger_address = debugger_address
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.implicitly_wait(config['browser']['implicit_wait'])
+    return driver
+
+@pytest.fixture(scope="session")
+def driver_pool(config):
+    """Fixture to provide the per-worker pool of reusable WebDriver instances"""
+    pool_config = config['browser'].get('pool', {})
+    if not pool_config.get('enabled', False):
+        yield None
+        return
+
+    pool = DriverPool(
+        lambda: create_driver(config),
+        max_uses=pool_config.get('max_uses', 20),
+        warm_spare=pool_config.get('warm_spare', True)
+    )
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def command_tracer(config):
+    """Fixture to provide the WebDriver command tracer when tracing is enabled"""
+    tracing_config = config.get('tracing', {})
+    if not tracing_config.get('enabled', False):
+        yield None
+        return
+
+    tracer = CommandTracer(top_n=tracing_config.get('top_n', 20))
+    yield tracer
+    tracer.write_report(
+        os.path.join(os.path.dirname(__file__), tracing_config.get('path', 'reports/profile')),
+        f"profile_{os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+    )
+
+@pytest.fixture(scope="session")
+def network_profiles(config):
+    """Fixture to provide the configured request-blocking profiles"""
+    return NetworkProfiles(config['network']['profiles'], default=config['network']['profile'])
+
+@pytest.fixture(scope="session")
+def network_usage(config):
+    """Fixture to provide the per-navigation request and byte accounting, when enabled"""
+    return NetworkUsage() if config['network'].get('report', False) else None
+
+@pytest.fixture(scope="session")
+def resource_monitor(config):
+    """Fixture to provide the browser resource sampler, when enabled"""
+    resource_config = config.get('resources', {})
+    if not resource_config.get('enabled', False):
+        return None
+    return ResourceMonitor(
+        max_rss_mb=resource_config.get('max_rss_mb'),
+        max_js_heap_mb=resource_config.get('max_js_heap_mb'),
+        max_cpu_seconds=resource_config.get('max_cpu_seconds')
+    )
+
+@pytest.fixture(scope="function")
+def driver(request, config, driver_pool, command_tracer, network_profiles, network_usage, resource_monitor):
+    """Fixture to provide WebDriver instance"""
+    driver = driver_pool.acquire() if driver_pool else create_driver(config)
+    try:
+        if command_tracer:
+            command_tracer.attach(driver)
+            command_tracer.current_test = request.node.nodeid
+        marker = request.node.get_closest_marker('network_profile')
+        network_profiles.apply(driver, marker.args[0] if marker else None)
+        resources_before = resource_monitor.sample(driver) if resource_monitor else None
+    except Exception:
+        # The pool no longer tracks an acquired driver, so a failed setup must not leak it
+        if driver_pool:
+            driver_pool.discard(driver)
+        else:
+            try:
                 driver.quit()
+            except Exception as e:
+                logging.error(f"Failed to quit Chrome driver: {str(e)}")
+        raise
+
+    yield driver
+
+    over_limits = []
+    if resource_monitor:
+        resources = resource_monitor.compare(resources_before, resource_monitor.sample(driver))
+        request.node.user_properties.append(('resources', resources))
+        over_limits = resource_monitor.exceeded(resources['after'])
+
+    if network_usage:
+        try:
+            for navigation in network_usage.collect(driver):
+                request.node.user_properties.append(('network', navigation))
+                saved = (
+                    f"~{navigation['saved_bytes']} bytes" if navigation['saved_bytes'] is not None
+                    else "bytes unknown (needs an earlier unblocked load of the same URLs)"
+                )
+                logging.info(
+                    f"{navigation['url']}: {navigation['requests']} requests, {navigation['bytes']} bytes loaded; "
+                    f"{navigation['blocked_requests']} requests, {saved} blocked"
+                )
+        except Exception as e:
+            logging.error(f"Failed to collect network usage: {str(e)}")
+
+    if driver_pool is None:
+        try:
+            driver.quit()
         except Exception as e:
             logging.error(f"Failed to quit Chrome driver: {str(e)}")
+    elif over_limits:
+        logging.info(f"Recycling driver over resource limits: {'; '.join(over_limits)}")
+        driver_pool.discard(driver)
+    else:
+        rep_call = getattr(request.node, 'rep_call', None)
+        driver_pool.release(driver, failed=rep_call is None or rep_call.failed)
+
+@pytest.fixture(scope="function")
+def browser_contexts(request, config, driver, network_profiles):
+    """Fixture to open isolated browser contexts inside the test driver's Chrome"""
+    marker = request.node.get_closest_marker('network_profile')
+    profile = marker.args[0] if marker else None
+    contexts = BrowserContexts(
+        driver,
+        lambda debugger_address: attach_driver(config, debugger_address),
+        max_workers=config['browser'].get('contexts', {}).get('max_workers', 4),
+        # Contexts get the test's network profile, like its driver
+        on_open=lambda context_driver: network_profiles.apply(context_driver, profile)
+    )
+    yield contexts
+    contexts.close()
+
+@pytest.fixture(scope="function")
+def browser_context(browser_contexts):
+    """Fixture to provide one isolated browser context with its own cookies and storage"""
+    return browser_contexts.open()
+
+@pytest.fixture(scope="session")
+def db_utils(config):
+    """Fixture to provide DatabaseUtils with every test-data user prefetched into its cache"""
+    db_utils = DatabaseUtils()
+    emails = [user['email'] for user in config['test_data'].values() if 'email' in user]
+    try:
+        db_utils.prefetch_users(emails)
+    except Exception as e:
+        logging.error(f"User prefetch failed, lookups will hit the database: {str(e)}")
+    yield db_utils
+    logging.info(f"User cache stats: {db_utils.user_cache.stats()}")
+
+def pytest_generate_tests(metafunc):
+    """Parametrize credential_shard over line-aligned byte ranges of the credential matrix file"""
+    if 'credential_shard' not in metafunc.fixturenames:
+        return
+    matrix_config = load_config()['credential_matrix']
+    path = os.path.join(os.path.dirname(__file__), matrix_config['path'])
+    shards = shard_file(path, matrix_config['shards'])
+    metafunc.parametrize('credential_shard', shards, ids=[shard.id for shard in shards])
+
+@pytest.fixture(scope="session")
+def seeded_users(config, db_utils):
+    """Fixture to collect users inserted during the session and delete them in bulk at the end"""
+    seeded = set()
+    yield seeded
+    if seeded:
+        db_utils.delete_users(seeded, config['credential_matrix']['seed_batch_size'])
+
+@pytest.fixture(scope="function")
+def credential_rows(request, config, credential_shard):
+    """Fixture to seed the shard's valid credentials and provide its rows as a lazy iterable"""
+    valid = {row['email']: row['password'] for row in credential_shard.rows() if row['expected'] == 'success'}
+    if not valid:
+        return credential_shard
+    if config['urls'].get('target') == 'local':
+        # The local app keeps its own users and never reads the database
+        app = request.getfixturevalue('local_app')
+        for email, password in valid.items():
+            app.add_user(email, password)
+        return credential_shard
+
+    seeded_users = request.getfixturevalue('seeded_users')
+    db_utils = request.getfixturevalue('db_utils')
+    missing = [(email, password) for email, password in valid.items() if email not in seeded_users]
+    if missing:
+        # Users that already existed are left alone here and at cleanup
+        seeded_users.update(db_utils.seed_users(missing, config['credential_matrix']['seed_batch_size']))
+    return credential_shard
+
+@pytest.fixture(scope="session")
+def auth_state_cache(config):
+    """Fixture to provide the per-worker cache of logged-in storage states"""
+    return AuthStateCache(ttl=config['auth']['state_ttl'])
+
+@pytest.fixture(scope="function")
+def logged_in_page(request, driver, config, auth_state_cache):
+    """Fixture to provide a LoginPage on the dashboard, restoring a cached login instead of using the UI"""
+    marker = request.node.get_closest_marker('login_as')
+    user_key = marker.args[0] if marker else 'valid_user'
+    login_page = LoginPage(driver)
+
+    restored = False
+    state = auth_state_cache.get(user_key)
+    if state:
+        try:
+            with auth_state_cache.inject(driver, state, login_page.dashboard_url):
+                login_page.navigate_to_dashboard(timeout=config['auth']['verify_timeout'])
+            restored = login_page.is_dashboard_displayed(timeout=0)
+        except Exception as e:
+            logging.error(f"Failed to restore session for {user_key}: {str(e)}")
+        if not restored:
+            logging.info(f"Restored session for {user_key} was rejected, logging in again")
+            auth_state_cache.discard(user_key)
+
+    if not restored:
+        user = config['test_data'][user_key]
+        login_page.navigate_to()
+        login_page.login(user['email'], user['password'])
+        assert login_page.is_dashboard_displayed(), f"Login as {user_key} failed"
+        auth_state_cache.capture(driver, user_key)
+
+    yield login_page
+
+    if login_page.logged_out:
+        # The server ended the session the snapshot holds; the next test would only wait for it to be rejected
+        auth_state_cache.discard(user_key)
+
+def tier_of(node):
+    """The tier a test runs on: 'ui' unless marked with @pytest.mark.tier"""
+    marker = node.get_closest_marker('tier')
+    return marker.args[0] if marker else 'ui'
+
+def uses_browser(request):
+    """Whether the test drives a browser, directly or through a UI-tier login_client"""
+    if 'driver' in request.fixturenames:
+        return True
+    return 'login_client' in request.fixturenames and tier_of(request.node) == 'ui'
 
 @pytest.fixture(scope="function")
-def screenshot_on_failure(request, driver):
-    """Fixture to take screenshot on test failure"""
+def login_client(request, config):
+    """Fixture to provide LoginPage or, under @pytest.mark.tier("api"), LoginApi against the target's JSON API"""
+    tier = tier_of(request.node)
+    if tier == 'ui':
+        yield LoginPage(request.getfixturevalue('driver'))
+    elif tier == 'api':
+        target = config['urls'].get('target')
+        if target not in config['api'].get('targets', []):
+            pytest.skip(f"No JSON login API is configured for urls.target '{target}'; "
+                        f"add it to api.targets to run the api tier")
+        api = LoginApi(config['urls']['base_url'])
+        yield api
+        api.close()
+    else:
+        raise ValueError(f"Unknown test tier: {tier}")
+
+@pytest.fixture(scope="session")
+def artifact_writer(config):
+    """Fixture to provide the background writer for screenshots and failure bundles"""
+    screenshot_config = config['screenshots']
+    writer = ArtifactWriter(
+        os.path.join(os.path.dirname(__file__), screenshot_config['path']),
+        max_workers=screenshot_config.get('writer_threads', 2),
+        max_pending_bytes=screenshot_config.get('max_pending_mb', 64) * 1024 * 1024
+    )
+    yield writer
+    writer.close()
+
+@pytest.fixture(scope="function", autouse=True)
+def screenshot_on_failure(request, config):
+    """Fixture to capture screenshot, page source and console logs after browser tests"""
+    if not uses_browser(request):
+        yield
+        return
+    # Requested here so the driver is still alive when this fixture tears down
+    driver = request.getfixturevalue('driver')
+    writer = request.getfixturevalue('artifact_writer')
     yield
-    
-    if request.node.rep_call.failed:
-        screenshot_dir = os.path.join(os.path.dirname(__file__), 'reports', 'screenshots')
-        os.makedirs(screenshot_dir, exist_ok=True)
-        
-        screenshot_path = os.path.join(
-            screenshot_dir,
-            f"{request.node.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        )
-        driver.save_screenshot(screenshot_path)
-        logging.info(f"Screenshot saved: {screenshot_path}")
+
+    rep_call = getattr(request.node, 'rep_call', None)
+    if rep_call is None:
+        return
+    screenshot_config = config['screenshots']
+    if not (rep_call.failed and screenshot_config['on_failure'] or
+            rep_call.passed and screenshot_config['on_success']):
+        return
+
+    try:
+        screenshot = driver.get_screenshot_as_png()
+        page_source = driver.page_source
+        try:
+            console_logs = driver.get_log('browser')
+        except Exception:
+            console_logs = None
+    except Exception as e:
+        logging.error(f"Failed to capture artifacts for {request.node.name}: {str(e)}")
+        return
+    writer.submit(request.node.name, screenshot, page_source, console_logs)
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -89,3 +458,87 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+
+    history = item.config.stash.get(test_history_key, None)
+    if history:
+        history.record_phase(item.nodeid, rep, getattr(item, 'execution_count', 1))
+
+def pytest_xdist_make_scheduler(config, log):
+    """Hook to distribute tests longest-first by their recorded durations under --dist load"""
+    scheduling_config = load_config()['scheduling']
+    history = config.stash.get(test_history_key, None)
+    if history is None or not scheduling_config.get('enabled', False) or config.getoption('dist') != 'load':
+        return None
+    from utils.scheduling import DurationScheduling
+    return DurationScheduling(
+        config,
+        log,
+        history=history,
+        window=scheduling_config.get('history_window', 10),
+        default_duration=scheduling_config.get('default_duration', 1.0)
+    )
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the pooled database connections, flush the test history and hand the startup report to xdist"""
+    close_pools()
+    history = session.config.stash.get(test_history_key, None)
+    if history:
+        history.flush()
+    if hasattr(session.config, 'workeroutput'):
+        session.config.workeroutput['startup'] = startup_profile.summary()
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report startup cost, the tests that grew the browser most and time spent on reruns"""
+    report_startup(terminalreporter, config)
+    report_resource_usage(terminalreporter)
+    history = config.stash.get(test_history_key, None)
+    if history is None:
+        return
+    reruns = history.rerun_summary()
+    if not reruns:
+        return
+    total = sum(rerun['seconds'] for rerun in reruns)
+    terminalreporter.section("time spent on reruns")
+    terminalreporter.write_line(
+        f"{sum(rerun['reruns'] for rerun in reruns)} reruns of {len(reruns)} tests cost {total:.2f}s"
+    )
+    for rerun in reruns:
+        terminalreporter.write_line(f"{rerun['seconds']:8.2f}s  {rerun['reruns']}x  {rerun['nodeid']}")
+
+def report_startup(terminalreporter, config):
+    """Write import, configure and collection time for this process and every xdist worker"""
+    if not load_config().get('startup', {}).get('report', True):
+        return
+    terminalreporter.section("startup")
+    for startup in [startup_profile.summary()] + config.stash.get(worker_startup_key, []):
+        phases = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in startup['phases'].items())
+        heavy = ", ".join(startup['heavy_modules_loaded']) or "none"
+        terminalreporter.write_line(
+            f"{startup['worker']}: {phases}; {startup['items']} items; heavy modules loaded: {heavy}"
+        )
+
+def report_resource_usage(terminalreporter):
+    """Write the tests with the largest browser RSS / JS heap growth"""
+    usage = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, 'when', None) != 'teardown':
+                continue
+            for name, value in getattr(report, 'user_properties', ()):
+                if name == 'resources':
+                    usage.append((report.nodeid, value))
+    if not usage:
+        return
+    top_n = load_config().get('resources', {}).get('top_n', 10)
+    usage.sort(key=lambda entry: (entry[1]['delta'].get('rss_mb') or 0, entry[1]['delta'].get('js_heap_mb') or 0), reverse=True)
+    terminalreporter.section("browser resources per test")
+    terminalreporter.write_line(f"{'rss MB':>10} {'heap MB':>10} {'cpu s':>8}  test")
+    for nodeid, resources in usage[:top_n]:
+        delta, after = resources['delta'], resources['after']
+        terminalreporter.write_line(
+            f"{_signed(delta.get('rss_mb')):>10} {_signed(delta.get('js_heap_mb')):>10} "
+            f"{_signed(delta.get('cpu_seconds')):>8}  {nodeid} (now {after.get('rss_mb')} MB rss)"
+        )
+
+def _signed(value):
+    return '-' if value is None else f"{value:+.1f}"
@@ -0,0 +1,156 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http.cookies import SimpleCookie
+import threading
+import logging
+import secrets
+import json
+import time
+import os
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+SESSION_COOKIE = 'session_id'
+INVALID_CREDENTIALS = "Invalid email or password"
+
+
+class LocalLoginApp:
+    """Stand-in for the login application, served from localhost.
+
+    Serves a hash-routed single page app with the element IDs LoginPage uses
+    (#/login, #/dashboard, #/forgot-password) and a small JSON API behind it.
+    ``latency_ms`` delays every response to mimic a remote deployment.
+    """
+
+    def __init__(self, users=None, host='127.0.0.1', port=0, latency_ms=0):
+        self.users = dict(users or {})
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.sessions = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._server = None
+        self._thread = None
+        with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as file:
+            self.index_html = file.read()
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def login_url(self):
+        return f"{self.base_url}/#/login"
+
+    @property
+    def dashboard_url(self):
+        return f"{self.base_url}/#/dashboard"
+
+    def add_user(self, email, password):
+        self.users[email] = password
+
+    def remove_user(self, email):
+        self.users.pop(email, None)
+
+    def start(self):
+        """Start serving on a background thread; port 0 picks a free port"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='local-login-app', daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Local login app listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self.logger.info("Local login app stopped")
+
+
+def _make_handler(app):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self._delay()
+            path = self.path.split('?', 1)[0]
+            if path in ('/', '/index.html', '/login'):
+                self._send(200, app.index_html, 'text/html; charset=utf-8')
+            elif path == '/api/session':
+                session = self._session()
+                if session:
+                    self._send_json(200, session)
+                else:
+                    self._send_json(401, {'error': "Not logged in"})
+            else:
+                self._send_json(404, {'error': "Not found"})
+
+        def do_POST(self):
+            self._delay()
+            path = self.path.split('?', 1)[0]
+            body = self._read_json()
+            if path == '/api/login':
+                email, password = body.get('email'), body.get('password')
+                if email in app.users and app.users[email] == password:
+                    token = secrets.token_hex(16)
+                    session = {'email': email, 'remember_me': bool(body.get('remember_me'))}
+                    app.sessions[token] = session
+                    max_age = '; Max-Age=2592000' if session['remember_me'] else ''
+                    cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax{max_age}"
+                    self._send_json(200, session, {'Set-Cookie': cookie})
+                else:
+                    self._send_json(401, {'error': INVALID_CREDENTIALS})
+            elif path == '/api/logout':
+                app.sessions.pop(self._token(), None)
+                cookie = f"{SESSION_COOKIE}=; Path=/; Max-Age=0"
+                self._send_json(200, {}, {'Set-Cookie': cookie})
+            elif path == '/api/forgot-password':
+                if body.get('email'):
+                    self._send_json(200, {'message': "If the account exists, a reset link has been sent"})
+                else:
+                    self._send_json(400, {'error': "Email is required"})
+            else:
+                self._send_json(404, {'error': "Not found"})
+
+        def log_message(self, format, *args):
+            app.logger.debug(format % args)
+
+        def _delay(self):
+            if app.latency_ms:
+                time.sleep(app.latency_ms / 1000)
+
+        def _token(self):
+            cookies = SimpleCookie(self.headers.get('Cookie', ''))
+            morsel = cookies.get(SESSION_COOKIE)
+            return morsel.value if morsel else None
+
+        def _session(self):
+            return app.sessions.get(self._token())
+
+        def _read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            if not length:
+                return {}
+            try:
+                return json.loads(self.rfile.read(length))
+            except ValueError:
+                return {}
+
+        def _send_json(self, status, payload, headers=None):
+            self._send(status, json.dumps(payload).encode(), 'application/json', headers)
+
+        def _send(self, status, body, content_type, headers=None):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
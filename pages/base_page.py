@@ -1,118 +1,329 @@
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
-import yaml
-import os
+from selenium.common.exceptions import (
+    NoSuchWindowException, StaleElementReferenceException, TimeoutException, WebDriverException
+)
+from utils.config_loader import load_config
+from utils.navigation import watch_navigation
+from contextlib import contextmanager
+from .elements import ElementProxy
+from . import scripts
 import logging
+import time
+
+# Observer mode: longest single script call (below the driver's script timeout)
+# and the in-page recheck interval for changes that do not mutate the DOM
+OBSERVER_CALL_LIMIT = 10
+OBSERVER_FALLBACK_INTERVAL = 0.1
+
+# How ChromeDriver reports an async script whose document was replaced mid-call
+DOCUMENT_REPLACED_MESSAGES = (
+    'document unloaded',
+    'execution context was destroyed',
+    'inspected target navigated or closed',
+)
+
+def document_replaced(error):
+    """Whether a script failed because its document went away rather than because of the script itself"""
+    if isinstance(error, (StaleElementReferenceException, NoSuchWindowException)):
+        return True
+    message = (getattr(error, 'msg', None) or str(error)).lower()
+    return any(text in message for text in DOCUMENT_REPLACED_MESSAGES)
+
+def polling_condition(state, locator):
+    """WebDriverWait condition used in polling mode for a wait state"""
+    # selenium.webdriver is imported on first use rather than when pages are imported
+    from selenium.webdriver.support import expected_conditions as EC
+    if state == 'absent':
+        return lambda driver: not driver.find_elements(*locator)
+    return {
+        'present': EC.presence_of_element_located,
+        'visible': EC.visibility_of_element_located,
+        'all_present': EC.presence_of_all_elements_located,
+        'hidden': EC.invisibility_of_element_located,
+    }[state](locator)
 
 class BasePage:
+    # Readiness condition waited on after navigation, instead of the load event
+    READY_LOCATORS = ()
+    READY_STATE = 'visible'
+
     def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(self.driver, 20)
-        self.actions = ActionChains(self.driver)
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.webdriver.support.wait import WebDriverWait
+        self.driver = watch_navigation(driver)
         self.load_config()
         self.setup_logging()
+        browser_config = self.config['browser']
+        self.implicit_wait = browser_config['implicit_wait']
+        self.explicit_wait = browser_config['explicit_wait']
+        self.absence_timeout = browser_config.get('absence_timeout', 2)
+        self.poll_frequency = browser_config.get('poll_frequency', 0.5)
+        self.wait_mode = browser_config.get('wait_mode', 'polling')
+        highlight = self.config.get('debug', {}).get('highlight', 'off')
+        # YAML reads bare on/off as booleans
+        self.highlight_mode = {True: 'on', False: 'off'}.get(highlight, highlight)
+        self.wait = WebDriverWait(self.driver, self.explicit_wait)
+        self.actions = ActionChains(self.driver)
 
     def load_config(self):
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
-        with open(config_path, 'r') as file:
-            self.config = yaml.safe_load(file)
+        self.config = load_config()
 
     def setup_logging(self):
+        # Handlers are configured once per process by utils.logging_setup
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-
-    def find_element(self, locator, timeout=20):
+
+    @contextmanager
+    def implicit_wait_suspended(self):
+        """Switch the implicit wait off so it does not stack on top of an explicit wait"""
+        depth = getattr(self.driver, '_implicit_wait_suspended', 0)
+        if depth == 0:
+            self.driver.implicitly_wait(0)
+        self.driver._implicit_wait_suspended = depth + 1
+        try:
+            yield
+        finally:
+            self.driver._implicit_wait_suspended = depth
+            if depth == 0:
+                self.driver.implicitly_wait(self.implicit_wait)
+
+    def wait_for(self, condition, timeout=None, poll_frequency=None, message=''):
+        """Run an explicit wait with the implicit wait switched off"""
+        from selenium.webdriver.support.wait import WebDriverWait
+        with self.implicit_wait_suspended():
+            return WebDriverWait(
+                self.driver,
+                self.explicit_wait if timeout is None else timeout,
+                poll_frequency=self.poll_frequency if poll_frequency is None else poll_frequency
+            ).until(condition, message)
+
+    def wait_until(self, locator, state, timeout=None, poll_frequency=None, message=''):
+        """Wait until locator is 'present', 'visible', 'all_present', 'absent' or 'hidden'.
+
+        Uses WebDriverWait polling, or an in-page MutationObserver when
+        browser.wait_mode is 'observer'.
+        """
+        if self.wait_mode == 'observer':
+            return self.observe(locator, state, timeout)
+        return self.wait_for(polling_condition(state, locator), timeout, poll_frequency, message)
+
+    def observe(self, locator, state='present', timeout=None):
+        """Wait in the page with a MutationObserver that resolves as soon as the state is reached.
+
+        Costs one round trip per wait instead of one per poll. Long waits are
+        split into calls of at most OBSERVER_CALL_LIMIT seconds, and a call
+        interrupted by a new document is retried on that document.
+        """
+        by, value = locator
+        timeout = self.explicit_wait if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            budget = min(max(deadline - time.monotonic(), 0), OBSERVER_CALL_LIMIT)
+            try:
+                result = self.driver.execute_async_script(
+                    scripts.WAIT_FOR, by, value, state,
+                    int(budget * 1000), int(OBSERVER_FALLBACK_INTERVAL * 1000)
+                )
+                if result is not None:
+                    return result
+            except WebDriverException as e:
+                # Only a document replaced while the observer was waiting is retried;
+                # an unsupported locator or state fails straight away
+                if not document_replaced(e):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutException(f"Element not {state}: {locator}") from e
+                time.sleep(OBSERVER_FALLBACK_INTERVAL)
+                continue
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Element not {state}: {locator}")
+
+    def find_element(self, locator, timeout=None, poll_frequency=None):
         """Find element with explicit wait"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            self.highlight_element(element)
+            element = self.wait_until(locator, 'present', timeout, poll_frequency)
+            if self.highlight_mode != 'off' and self.should_highlight():
+                self.highlight_element(element)
             return element
         except Exception as e:
             self.logger.error(f"Element not found: {locator}")
             raise e
 
-    def find_elements(self, locator, timeout=20):
+    def find_elements(self, locator, timeout=None, poll_frequency=None):
         """Find elements with explicit wait"""
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located(locator)
-            )
+            elements = self.wait_until(locator, 'all_present', timeout, poll_frequency)
             return elements
         except Exception as e:
             self.logger.error(f"Elements not found: {locator}")
             raise e
 
-    def click_element(self, locator, timeout=20):
-        """Click element with explicit wait"""
+    def click_element(self, locator, timeout=None):
+        """Click element with explicit wait; accepts a locator or an ElementProxy"""
         try:
-            element = self.find_element(locator, timeout)
-            element.click()
+            self._perform(locator, lambda element: element.click(), timeout)
         except Exception as e:
             self.logger.error(f"Failed to click element: {locator}")
             raise e
 
-    def send_keys(self, locator, text, timeout=20):
-        """Send keys to element with explicit wait"""
-        try:
-            element = self.find_element(locator, timeout)
+    def send_keys(self, locator, text, timeout=None):
+        """Send keys to element with explicit wait; accepts a locator or an ElementProxy"""
+        def clear_and_type(element):
             element.clear()
             element.send_keys(text)
+        try:
+            self._perform(locator, clear_and_type, timeout)
         except Exception as e:
             self.logger.error(f"Failed to send keys to element: {locator}")
             raise e
 
-    def get_text(self, locator, timeout=20):
-        """Get text from element with explicit wait"""
+    def get_text(self, locator, timeout=None):
+        """Get text from element with explicit wait; accepts a locator or an ElementProxy"""
         try:
-            element = self.find_element(locator, timeout)
-            return element.text
+            return self._perform(locator, lambda element: element.text, timeout)
         except Exception as e:
             self.logger.error(f"Failed to get text from element: {locator}")
             raise e
 
+    def _perform(self, target, operation, timeout=None):
+        if isinstance(target, ElementProxy):
+            return target.perform(operation, timeout)
+        return operation(self.find_element(target, timeout))
+
+    def should_highlight(self):
+        """Check if elements should be highlighted under the configured debug.highlight mode"""
+        if self.highlight_mode == 'recording':
+            return getattr(self.driver, 'recording', False)
+        return self.highlight_mode == 'on'
+
     def highlight_element(self, element, duration=1):
         """Highlight element for visual feedback"""
         try:
-            original_style = element.get_attribute('style')
-            self.driver.execute_script(
-                "arguments[0].setAttribute('style', arguments[1]);",
-                element,
-                "background: yellow; border: 2px solid red;"
-            )
             self.driver.execute_script(
-                "arguments[0].setAttribute('style', arguments[1]);",
+                scripts.HIGHLIGHT,
                 element,
-                original_style
+                "background: yellow; border: 2px solid red;",
+                int(duration * 1000)
             )
         except Exception as e:
             self.logger.error("Failed to highlight element")
             raise e
 
-    def is_element_visible(self, locator, timeout=20):
+    def is_element_visible(self, locator, timeout=None, poll_frequency=None):
         """Check if element is visible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.wait_until(locator, 'visible', timeout, poll_frequency)
             return True
         except:
             return False
 
-    def is_element_present(self, locator, timeout=20):
+    def is_element_present(self, locator, timeout=None, poll_frequency=None):
         """Check if element is present in DOM"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            self.wait_until(locator, 'present', timeout, poll_frequency)
+            return True
+        except:
+            return False
+
+    def is_element_absent(self, locator, timeout=None, poll_frequency=None):
+        """Check if element is missing from the DOM, waiting at most the absence budget"""
+        try:
+            self.wait_until(
+                locator,
+                'absent',
+                self.absence_timeout if timeout is None else timeout,
+                poll_frequency
             )
             return True
         except:
-            return False 
\ No newline at end of file
+            return False
+
+    def wait_until_gone(self, locator, timeout=None, poll_frequency=None):
+        """Wait until element is hidden or removed from the DOM"""
+        try:
+            self.wait_until(
+                locator,
+                'hidden',
+                self.absence_timeout if timeout is None else timeout,
+                poll_frequency,
+                f"Element still visible: {locator}"
+            )
+        except TimeoutException as e:
+            self.logger.error(f"Element did not disappear: {locator}")
+            raise e
+
+    def probe(self, locators, state='visible', attributes=(), timeout=None, poll_frequency=None):
+        """Resolve presence, visibility, text and attributes of several locators in one round trip.
+
+        The browser polls until every locator reaches ``state`` ('present',
+        'visible', 'interactive' or 'absent') or the timeout expires, then returns a dict of
+        {present, visible, enabled, text, attributes, ok} per locator. ``locators`` may be
+        a list of locator tuples or a dict of name -> locator; the result is
+        keyed the same way. The timeout must stay below the driver's script timeout.
+        """
+        keys = list(locators)
+        targets = [locators[key] for key in keys] if isinstance(locators, dict) else keys
+        specs = [
+            {'by': by, 'value': value, 'state': state, 'attributes': list(attributes)}
+            for by, value in targets
+        ]
+        timeout = self.explicit_wait if timeout is None else timeout
+        poll_frequency = self.poll_frequency if poll_frequency is None else poll_frequency
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            try:
+                results = self.driver.execute_async_script(
+                    scripts.PROBE, specs, int(remaining * 1000), int(poll_frequency * 1000)
+                )
+                return dict(zip(keys, results))
+            except WebDriverException as e:
+                # The document was replaced while the script was polling; retry on the new one
+                if not document_replaced(e):
+                    self.logger.error(f"Failed to probe elements: {targets}")
+                    raise
+                if time.monotonic() >= deadline:
+                    self.logger.error(f"Failed to probe elements: {targets}")
+                    raise e
+                time.sleep(poll_frequency)
+
+    def are_elements_visible(self, *locators, timeout=None, poll_frequency=None):
+        """Check that all elements are visible using a single probe"""
+        try:
+            results = self.probe(locators, 'visible', timeout=timeout, poll_frequency=poll_frequency)
+            return all(result['ok'] for result in results.values())
+        except:
+            return False
+
+    def navigate(self, url, ready_locators=None, ready_state=None, timeout=None):
+        """Navigate to url and wait only for the page's own readiness condition"""
+        self.driver.get(url)
+        self.invalidate_elements()
+        self.wait_until_ready(ready_locators, ready_state, timeout)
+
+    def reload(self, ready_locators=None, ready_state=None, timeout=None):
+        """Reload the current page and wait only for the page's own readiness condition"""
+        self.driver.refresh()
+        self.invalidate_elements()
+        self.wait_until_ready(ready_locators, ready_state, timeout)
+
+    def invalidate_elements(self):
+        """Drop the elements cached by every page object sharing this driver.
+
+        Called on navigation and by page methods that change the SPA route,
+        since a view that is hidden rather than re-rendered never goes stale.
+        Navigation issued straight on the driver is caught by ``utils.navigation.watch_navigation``.
+        """
+        # ElementProxy compares this counter with the one its element was found under
+        self.driver._navigation_id = getattr(self.driver, '_navigation_id', 0) + 1
+
+    def wait_until_ready(self, ready_locators=None, ready_state=None, timeout=None):
+        """Wait until the readiness locators reach the readiness state"""
+        locators = self.READY_LOCATORS if ready_locators is None else ready_locators
+        if not locators:
+            return
+        state = ready_state or self.READY_STATE
+        results = self.probe(locators, state, timeout=timeout)
+        pending = [locator for locator, result in results.items() if not result['ok']]
+        if pending:
+            self.logger.error(f"Page not ready, still waiting for {state}: {pending}")
+            raise TimeoutException(f"Page not ready: {pending} not {state}")
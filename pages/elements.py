@@ -0,0 +1,76 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from utils.navigation import navigation_id
+
+
+class Element:
+    """Class-level declaration of a page element, resolved lazily per page instance.
+
+    ``email_input = Element(By.ID, "login-username")`` gives every page object
+    its own ElementProxy. The proxy finds the element on first use and reuses
+    the WebElement until the page navigates or changes route (see
+    ``utils.navigation.watch_navigation`` and ``BasePage.invalidate_elements``).
+    """
+
+    def __init__(self, by, value):
+        self.locator = (by, value)
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        proxies = page.__dict__.setdefault('_element_proxies', {})
+        proxy = proxies.get(self.name)
+        if proxy is None:
+            proxy = proxies[self.name] = ElementProxy(page, self.locator, self.name)
+        return proxy
+
+
+class ElementProxy:
+    """A cached WebElement that is re-found when it goes stale or the page navigates.
+
+    Attribute access and method calls are forwarded to the WebElement. A
+    StaleElementReferenceException, e.g. after an SPA route replaced the view,
+    drops the cached reference and the call is retried once on a fresh lookup.
+    """
+
+    def __init__(self, page, locator, name=None):
+        self.page = page
+        self.locator = locator
+        self.name = name or str(locator)
+        self._element = None
+        self._navigation_id = None
+
+    def resolve(self, timeout=None):
+        """Return the cached WebElement, finding it when missing or from an earlier navigation"""
+        current = navigation_id(self.page.driver)
+        if self._element is None or self._navigation_id != current:
+            self._element = self.page.find_element(self.locator, timeout)
+            self._navigation_id = current
+        return self._element
+
+    def invalidate(self):
+        self._element = None
+
+    def perform(self, operation, timeout=None):
+        """Run ``operation(element)``, re-finding the element once if it has gone stale"""
+        try:
+            return operation(self.resolve(timeout))
+        except StaleElementReferenceException:
+            self.page.logger.info(f"Element '{self.name}' went stale, finding it again")
+            self.invalidate()
+            return operation(self.resolve(timeout))
+
+    def __getattr__(self, name):
+        value = self.perform(lambda element: getattr(element, name))
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            return self.perform(lambda element: getattr(element, name)(*args, **kwargs))
+        return call
+
+    def __repr__(self):
+        return f"<{self.name} {self.locator}>"
@@ -0,0 +1,16 @@
+class By:
+    """Locator strategies, with the same string values as selenium's By.
+
+    Importing anything under ``selenium.webdriver`` loads the package for every
+    browser, so page objects declare locators with these constants and only
+    pay for selenium once a page is created with a driver.
+    """
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
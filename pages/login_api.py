@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from utils.config_loader import load_config
+import threading
+import logging
+
+_adapter = None
+_adapter_lock = threading.Lock()
+
+
+def get_adapter(pool_maxsize=32):
+    """Return the process-wide HTTPAdapter whose keep-alive connections every LoginApi shares"""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            from requests.adapters import HTTPAdapter
+            _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        return _adapter
+
+
+class LoginApi:
+    """Protocol-level counterpart of LoginPage: the same checks over the login app's JSON API.
+
+    Each instance is one user session with its own cookie jar. The underlying
+    connections come from a shared pool, so creating an instance per
+    scenario or per thread is cheap. The JSON API is the one served by the
+    local_app stand-in; ``base_url`` defaults to ``urls.base_url``.
+    """
+
+    def __init__(self, base_url=None, adapter=None):
+        import requests
+        self.config = load_config()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        api_config = self.config['api']
+        self.base_url = (base_url or self.config['urls']['base_url']).rstrip('/')
+        self.timeout = api_config.get('timeout', 10)
+        self.paths = api_config['paths']
+        self.session = requests.Session()
+        adapter = adapter or get_adapter(api_config.get('pool_maxsize', 32))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.last_response = None
+
+    def navigate_to(self):
+        """Load the login page, which also primes a pooled connection"""
+        self.last_response = self._request('GET', self.paths['login_page'])
+        self.logger.info("Loaded login page")
+
+    def login(self, email, password, remember_me=False):
+        """Login with given credentials"""
+        try:
+            self.last_response = self._request('POST', self.paths['login'], json={
+                'email': email,
+                'password': password,
+                'remember_me': remember_me
+            })
+            self.logger.info(f"Attempted login with email: {email}")
+        except Exception as e:
+            self.logger.error(f"Login failed: {str(e)}")
+            raise e
+
+    def get_error_message(self):
+        """Get error message of the last request, if it failed"""
+        try:
+            if self.last_response is None or self.last_response.ok:
+                return None
+            return self.last_response.json().get('error')
+        except Exception as e:
+            self.logger.error(f"Failed to get error message: {str(e)}")
+            return None
+
+    def is_login_page_displayed(self):
+        """Check if the login page was served"""
+        return self.last_response is not None and self.last_response.ok
+
+    def is_dashboard_displayed(self):
+        """Check if the session is logged in, i.e. the dashboard would load"""
+        try:
+            return self._request('GET', self.paths['session']).status_code == 200
+        except Exception as e:
+            self.logger.error(f"Failed to check if dashboard is displayed: {str(e)}")
+            return False
+
+    def is_dashboard_absent(self):
+        """Check that the session is not logged in"""
+        try:
+            return self._request('GET', self.paths['session']).status_code == 401
+        except Exception as e:
+            self.logger.error(f"Failed to check if dashboard is absent: {str(e)}")
+            return False
+
+    def logout(self):
+        """Logout from the application"""
+        try:
+            self.last_response = self._request('POST', self.paths['logout'])
+            self.logger.info("Logged out successfully")
+        except Exception as e:
+            self.logger.error(f"Failed to logout: {str(e)}")
+            raise e
+
+    def is_logged_out(self):
+        """Check if user is logged out"""
+        return self.is_dashboard_absent()
+
+    def close(self):
+        # Session.close() would also close the shared adapter's connection pool
+        self.session.cookies.clear()
+
+    def _request(self, method, path, **kwargs):
+        return self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+
+
+def check_credentials(row, base_url=None):
+    """Run one credential row (email, password, expected, error) through the API; return a failure or None"""
+    api = LoginApi(base_url)
+    try:
+        api.login(row['email'], row['password'])
+        if row['expected'] == 'success':
+            if not api.is_dashboard_displayed():
+                return f"{row['email']}: not logged in"
+            api.logout()
+            if not api.is_logged_out():
+                return f"{row['email']}: still logged in after logout"
+        else:
+            error_message = api.get_error_message()
+            if not error_message or row['error'] not in error_message:
+                return f"{row['email']}: unexpected error message {error_message!r}"
+            if not api.is_dashboard_absent():
+                return f"{row['email']}: logged in with rejected credentials"
+        return None
+    finally:
+        api.close()
+
+
+def run_login_matrix(rows, max_workers=16, base_url=None):
+    """Check every credential row concurrently and return the failure messages"""
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='login-api') as executor:
+        return [failure for failure in executor.map(partial(check_credentials, base_url=base_url), rows) if failure]
@@ -1,5 +1,6 @@
-from selenium.webdriver.common.by import By
+from .locators import By
 from .base_page import BasePage
+from .elements import Element
 
 class LoginPage(BasePage):
     # Locators
@@ -17,25 +18,52 @@ class LoginPage(BasePage):
     USER_MENU = (By.ID, "js-user-menu")
     LOGOUT_BUTTON = (By.ID, "js-logout-btn")
 
+    # Elements interacted with; found on first use and cached until the page navigates
+    email_input = Element(*EMAIL_INPUT)
+    password_input = Element(*PASSWORD_INPUT)
+    login_button = Element(*LOGIN_BUTTON)
+    error_message = Element(*ERROR_MESSAGE)
+    remember_me_checkbox = Element(*REMEMBER_ME_CHECKBOX)
+    forgot_password_link = Element(*FORGOT_PASSWORD_LINK)
+    email_label = Element(*EMAIL_LABEL)
+    password_label = Element(*PASSWORD_LABEL)
+    user_menu = Element(*USER_MENU)
+    logout_button = Element(*LOGOUT_BUTTON)
+
+    # Login form interactive; the dashboard is ready once its header renders
+    READY_LOCATORS = (EMAIL_INPUT, PASSWORD_INPUT, LOGIN_BUTTON)
+    READY_STATE = 'interactive'
+    DASHBOARD_READY_LOCATORS = (DASHBOARD_HEADER,)
+
     def __init__(self, driver):
         super().__init__(driver)
         self.url = self.config['urls']['login_url']
+        self.dashboard_url = self.config['urls']['dashboard_url']
+        # Set by logout(), which also invalidates any captured snapshot of this session
+        self.logged_out = False
 
     def navigate_to(self):
         """Navigate to login page"""
-        self.driver.get(self.url)
+        self.navigate(self.url)
         self.logger.info("Navigated to login page")
 
+    def navigate_to_dashboard(self, timeout=None):
+        """Navigate straight to the dashboard, e.g. with a restored session"""
+        self.navigate(self.dashboard_url, self.DASHBOARD_READY_LOCATORS, 'visible', timeout)
+        self.logger.info("Navigated to dashboard")
+
     def login(self, email, password, remember_me=False):
         """Login with given credentials"""
         try:
-            self.send_keys(self.EMAIL_INPUT, email)
-            self.send_keys(self.PASSWORD_INPUT, password)
+            self.send_keys(self.email_input, email)
+            self.send_keys(self.password_input, password)
             
             if remember_me:
-                self.click_element(self.REMEMBER_ME_CHECKBOX)
+                self.click_element(self.remember_me_checkbox)
             
-            self.click_element(self.LOGIN_BUTTON)
+            self.click_element(self.login_button)
+            # A successful login changes the hash route without a navigation
+            self.invalidate_elements()
             self.logger.info(f"Attempted login with email: {email}")
         except Exception as e:
             self.logger.error(f"Login failed: {str(e)}")
@@ -44,7 +72,7 @@ class LoginPage(BasePage):
     def get_error_message(self):
         """Get error message if login fails"""
         try:
-            return self.get_text(self.ERROR_MESSAGE)
+            return self.get_text(self.error_message)
         except Exception as e:
             self.logger.error(f"Failed to get error message: {str(e)}")
             return None
@@ -52,7 +80,8 @@ class LoginPage(BasePage):
     def click_forgot_password(self):
         """Click on forgot password link"""
         try:
-            self.click_element(self.FORGOT_PASSWORD_LINK)
+            self.click_element(self.forgot_password_link)
+            self.invalidate_elements()
             self.logger.info("Clicked on forgot password link")
         except Exception as e:
             self.logger.error(f"Failed to click forgot password link: {str(e)}")
@@ -61,18 +90,15 @@ class LoginPage(BasePage):
     def is_login_page_displayed(self):
         """Check if login page is displayed"""
         try:
-            return (self.is_element_visible(self.LOGIN_BUTTON) and 
-                   self.is_element_visible(self.EMAIL_INPUT) and 
-                   self.is_element_visible(self.PASSWORD_INPUT))
+            return self.are_elements_visible(self.LOGIN_BUTTON, self.EMAIL_INPUT, self.PASSWORD_INPUT)
         except Exception as e:
             self.logger.error(f"Failed to check if login page is displayed: {str(e)}")
             return False
 
-    def is_dashboard_displayed(self):
+    def is_dashboard_displayed(self, timeout=None):
         """Check if dashboard is displayed after successful login"""
         try:
-            return (self.is_element_visible(self.DASHBOARD_HEADER) and 
-                   self.is_element_visible(self.USER_MENU))
+            return self.are_elements_visible(self.DASHBOARD_HEADER, self.USER_MENU, timeout=timeout)
         except Exception as e:
             self.logger.error(f"Failed to check if dashboard is displayed: {str(e)}")
             return False
@@ -88,7 +114,7 @@ class LoginPage(BasePage):
     def get_email_label_text(self):
         """Get email input label text"""
         try:
-            return self.get_text(self.EMAIL_LABEL)
+            return self.get_text(self.email_label)
         except Exception as e:
             self.logger.error(f"Failed to get email label text: {str(e)}")
             return None
@@ -96,7 +122,7 @@ class LoginPage(BasePage):
     def get_password_label_text(self):
         """Get password input label text"""
         try:
-            return self.get_text(self.PASSWORD_LABEL)
+            return self.get_text(self.password_label)
         except Exception as e:
             self.logger.error(f"Failed to get password label text: {str(e)}")
             return None
@@ -104,7 +130,7 @@ class LoginPage(BasePage):
     def is_remember_me_checked(self):
         """Check if remember me checkbox is checked"""
         try:
-            return self.find_element(self.REMEMBER_ME_CHECKBOX).is_selected()
+            return self.remember_me_checkbox.is_selected()
         except Exception as e:
             self.logger.error(f"Failed to check remember me status: {str(e)}")
             return False
@@ -112,16 +138,33 @@ class LoginPage(BasePage):
     def logout(self):
         """Logout from the application"""
         try:
-            self.click_element(self.USER_MENU)
-            self.click_element(self.LOGOUT_BUTTON)
+            self.click_element(self.user_menu)
+            self.click_element(self.logout_button)
+            self.invalidate_elements()
+            self.logged_out = True
             self.logger.info("Logged out successfully")
         except Exception as e:
             self.logger.error(f"Failed to logout: {str(e)}")
             raise e
 
+    def is_dashboard_absent(self, timeout=None):
+        """Check that the dashboard did not appear, e.g. after a rejected login"""
+        try:
+            results = self.probe(
+                [self.USER_MENU, self.DASHBOARD_HEADER],
+                'absent',
+                timeout=self.absence_timeout if timeout is None else timeout
+            )
+            return all(result['ok'] for result in results.values())
+        except Exception as e:
+            self.logger.error(f"Failed to check if dashboard is absent: {str(e)}")
+            return False
+
     def is_logged_out(self):
         """Check if user is logged out"""
         try:
+            # Logging out is a round trip and a route change, not an absence check
+            self.wait_until_gone(self.USER_MENU, timeout=self.explicit_wait)
             return self.is_login_page_displayed()
         except Exception as e:
             self.logger.error(f"Failed to check logout status: {str(e)}")
@@ -0,0 +1,185 @@
+# JavaScript executed in the page by BasePage. Locators are passed in as
+# [by, value] pairs using the same strategy names as selenium's By.
+
+FIND_ELEMENT = """
+function findElement(by, value) {
+    switch (by) {
+        case 'id':
+            return document.getElementById(value);
+        case 'css selector':
+            return document.querySelector(value);
+        case 'xpath':
+            return document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'name':
+            return document.getElementsByName(value)[0] || null;
+        case 'class name':
+            return document.getElementsByClassName(value)[0] || null;
+        case 'tag name':
+            return document.getElementsByTagName(value)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].innerText.trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isVisible(element) {
+    if (!element || !element.isConnected) {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    if (style.display === 'none' || style.visibility === 'hidden') {
+        return false;
+    }
+    var rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# arguments: specs, timeout (ms), interval (ms), callback
+# spec: {by, value, state: 'present' | 'visible' | 'interactive' | 'absent', attributes: [...]}
+PROBE = FIND_ELEMENT + """
+var specs = arguments[0], timeout = arguments[1], interval = arguments[2];
+var done = arguments[arguments.length - 1];
+var deadline = Date.now() + timeout;
+
+function snapshot() {
+    return specs.map(function (spec) {
+        var element = findElement(spec.by, spec.value);
+        var result = {
+            present: !!element,
+            visible: isVisible(element),
+            text: element ? (element.innerText || element.textContent || '').trim() : null,
+            attributes: {}
+        };
+        spec.attributes.forEach(function (name) {
+            result.attributes[name] = element ? element.getAttribute(name) : null;
+        });
+        result.enabled = !!element && !element.disabled;
+        result.ok = spec.state === 'absent' ? !result.present :
+            spec.state === 'present' ? result.present :
+            spec.state === 'interactive' ? result.visible && result.enabled : result.visible;
+        return result;
+    });
+}
+
+(function poll() {
+    var results = snapshot();
+    var ok = results.every(function (result) { return result.ok; });
+    if (ok || Date.now() >= deadline) {
+        done(results);
+    } else {
+        setTimeout(poll, interval);
+    }
+})();
+"""
+
+# arguments: element, highlight style, duration (ms)
+HIGHLIGHT = """
+var element = arguments[0], original = element.getAttribute('style');
+element.setAttribute('style', arguments[1]);
+setTimeout(function () {
+    if (original === null) {
+        element.removeAttribute('style');
+    } else {
+        element.setAttribute('style', original);
+    }
+}, arguments[2]);
+"""
+
+FIND_ELEMENTS = """
+function findElements(by, value) {
+    switch (by) {
+        case 'css selector':
+            return Array.prototype.slice.call(document.querySelectorAll(value));
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        case 'name':
+            return Array.prototype.slice.call(document.getElementsByName(value));
+        case 'class name':
+            return Array.prototype.slice.call(document.getElementsByClassName(value));
+        case 'tag name':
+            return Array.prototype.slice.call(document.getElementsByTagName(value));
+    }
+    var element = findElement(by, value);
+    return element ? [element] : [];
+}
+"""
+
+# arguments: by, value, state, timeout (ms), fallback interval (ms), callback
+# state: 'present' | 'visible' | 'all_present' | 'absent' | 'hidden'
+# Calls back with the element (a list for all_present, true for absent/hidden),
+# or null when the timeout expires first.
+WAIT_FOR = FIND_ELEMENT + FIND_ELEMENTS + """
+var by = arguments[0], value = arguments[1], state = arguments[2];
+var timeout = arguments[3], interval = arguments[4];
+var done = arguments[arguments.length - 1];
+var observer = null, timer = null, fallback = null, finished = false;
+
+function check() {
+    var element;
+    switch (state) {
+        case 'present':
+            element = findElement(by, value);
+            return element ? {value: element} : null;
+        case 'visible':
+            element = findElement(by, value);
+            return isVisible(element) ? {value: element} : null;
+        case 'all_present':
+            var elements = findElements(by, value);
+            return elements.length ? {value: elements} : null;
+        case 'absent':
+            return findElement(by, value) ? null : {value: true};
+        case 'hidden':
+            return isVisible(findElement(by, value)) ? null : {value: true};
+    }
+    throw new Error('Unsupported wait state: ' + state);
+}
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearTimeout(timer);
+    clearInterval(fallback);
+    done(result ? result.value : null);
+}
+
+function recheck() {
+    var result = check();
+    if (result) {
+        finish(result);
+    }
+}
+
+var initial = check();
+if (initial) {
+    finish(initial);
+} else {
+    observer = new MutationObserver(recheck);
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    // Visibility can also change without a DOM mutation (stylesheets, transitions)
+    fallback = setInterval(recheck, interval);
+    timer = setTimeout(function () { finish(null); }, timeout);
+}
+"""
@@ -1,6 +1,5 @@
 import pytest
 from pages.login_page import LoginPage
-from utils.db_utils import DatabaseUtils
 import allure
 
 @allure.epic("VWO Login Tests")
@@ -8,11 +7,11 @@ import allure
 class TestLoginPOM:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, driver, config, db_utils):
         self.driver = driver
         self.config = config
         self.login_page = LoginPage(driver)
-        self.db_utils = DatabaseUtils()
+        self.db_utils = db_utils
 
     @allure.story("Valid Login")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -0,0 +1,17 @@
+import zipfile
+from utils.artifacts import ArtifactWriter
+
+
+class TestArtifactWriter:
+
+    def test_bundle_written_after_close(self, tmp_path):
+        writer = ArtifactWriter(str(tmp_path), max_pending_bytes=16)
+        for index in range(3):
+            writer.submit(f"test_case[{index}]", b"\x89PNG" * 8, "<html></html>", [{'message': 'error'}])
+        writer.close()
+
+        assert len(list(tmp_path.glob("test_case_*.png"))) == 3
+        bundle = next(tmp_path.glob("test_case_0_*.zip"))
+        with zipfile.ZipFile(bundle) as archive:
+            assert sorted(archive.namelist()) == ['console_logs.json', 'page_source.html']
+        assert writer._pending_bytes == 0
@@ -0,0 +1,70 @@
+import time
+import pytest
+from utils.auth_state import AuthStateCache, _settable_cookie
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_script(self, script):
+        return {'origin': "https://app.example.com", 'local_storage': {'token': "abc"}, 'session_storage': {}}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append(cmd)
+        if cmd == 'Network.getAllCookies':
+            return {'cookies': [{'name': "session_id", 'value': "1", 'expires': -1, 'size': 11}]}
+        if cmd == 'Page.addScriptToEvaluateOnNewDocument':
+            return {'identifier': "1"}
+        return {}
+
+
+def state(captured_at, expires=-1):
+    return {'captured_at': captured_at, 'cookies': [{'name': "session_id", 'expires': expires}]}
+
+
+class TestAuthStateCache:
+
+    def test_expiry_by_ttl_and_cookie_expiry(self):
+        cache = AuthStateCache(ttl=60)
+        now = time.time()
+        assert not cache.is_expired(state(now - 30))
+        assert cache.is_expired(state(now - 61))
+        assert cache.is_expired(state(now - 30, expires=now - 1))
+        # Session cookies report expires -1 and last as long as the snapshot
+        assert not cache.is_expired(state(now - 30, expires=-1))
+
+    def test_expired_snapshot_is_discarded(self):
+        cache = AuthStateCache(ttl=60)
+        cache.capture(FakeDriver(), 'valid_user')
+        assert cache.get('valid_user')['local_storage'] == {'token': "abc"}
+
+        cache._states['valid_user']['captured_at'] -= 61
+        assert cache.get('valid_user') is None
+        assert 'valid_user' not in cache._states
+
+    def test_inject_scopes_the_restore_script_to_the_block(self):
+        cache = AuthStateCache()
+        driver = FakeDriver()
+        snapshot = cache.capture(driver, 'valid_user')
+
+        with cache.inject(driver, snapshot, "https://app.example.com/#/dashboard"):
+            assert driver.commands[-2:] == ['Network.setCookies', 'Page.addScriptToEvaluateOnNewDocument']
+        assert driver.commands[-1] == 'Page.removeScriptToEvaluateOnNewDocument'
+
+        with pytest.raises(ValueError):
+            with cache.inject(driver, snapshot, "https://other.example.com/"):
+                pass
+
+    def test_settable_cookie_keeps_only_setcookies_fields(self):
+        cookie = {
+            'name': "session_id", 'value': "1", 'domain': "app.example.com", 'path': "/",
+            'expires': 1900000000, 'size': 11, 'session': False, 'httpOnly': True, 'sourcePort': 443
+        }
+        assert _settable_cookie(cookie) == {
+            'name': "session_id", 'value': "1", 'domain': "app.example.com", 'path': "/",
+            'expires': 1900000000, 'httpOnly': True
+        }
+        # A non-positive expiry would delete a session cookie instead of setting it
+        assert 'expires' not in _settable_cookie(dict(cookie, expires=-1))
@@ -0,0 +1,408 @@
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
+from types import SimpleNamespace
+import subprocess
+import shutil
+import json
+import time
+import pytest
+from pages import scripts
+from pages import base_page
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.config_loader import load_config
+
+
+class ScriptedDriver:
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        result = self.results.pop(0) if self.results else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class FakeWebElement:
+
+    def __init__(self, displayed):
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class PollingDriver:
+    """Driver whose element is present and displayed according to the number of polls so far"""
+
+    def __init__(self, present=lambda polls: False, displayed=lambda polls: True):
+        self.present = present
+        self.displayed = displayed
+        self.polls = 0
+        self.implicit_waits = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+
+    def find_element(self, by, value):
+        self.polls += 1
+        if not self.present(self.polls):
+            raise NoSuchElementException(f"no such element: {value}")
+        return FakeWebElement(self.displayed(self.polls))
+
+    def find_elements(self, by, value):
+        self.polls += 1
+        return [FakeWebElement(self.displayed(self.polls))] if self.present(self.polls) else []
+
+
+def polling_page(driver, absence_timeout=0.2):
+    page = BasePage(driver)
+    page.poll_frequency = 0.01
+    page.absence_timeout = absence_timeout
+    return page
+
+
+class TestPollingWaits:
+
+    def test_wait_times_out_without_stacking_the_implicit_wait(self):
+        driver = PollingDriver()
+        page = polling_page(driver)
+
+        started = time.monotonic()
+        assert not page.is_element_visible(("id", "js-user-menu"), timeout=0.2)
+        assert time.monotonic() - started < 1
+        # Switched off for the explicit wait, then put back
+        assert driver.implicit_waits == [0, page.implicit_wait]
+
+    def test_nested_waits_suspend_the_implicit_wait_once(self):
+        driver = PollingDriver(present=lambda polls: True)
+        page = polling_page(driver)
+
+        with page.implicit_wait_suspended():
+            assert page.is_element_present(("id", "js-user-menu"))
+            assert driver.implicit_waits == [0]
+        assert driver.implicit_waits == [0, page.implicit_wait]
+
+    def test_absent_uses_the_absence_budget(self):
+        page = polling_page(PollingDriver(present=lambda polls: polls < 3))
+        assert page.is_element_absent(("id", "js-user-menu"))
+
+        page = polling_page(PollingDriver(present=lambda polls: True), absence_timeout=0.1)
+        started = time.monotonic()
+        assert not page.is_element_absent(("id", "js-user-menu"))
+        assert time.monotonic() - started < page.explicit_wait / 10
+
+    def test_gone_when_hidden_or_removed(self):
+        page = polling_page(PollingDriver(present=lambda polls: True, displayed=lambda polls: polls < 3))
+        page.wait_until_gone(("id", "js-user-menu"))
+
+        page = polling_page(PollingDriver(present=lambda polls: polls < 3))
+        page.wait_until_gone(("id", "js-user-menu"))
+
+        page = polling_page(PollingDriver(present=lambda polls: True))
+        with pytest.raises(TimeoutException):
+            page.wait_until_gone(("id", "js-user-menu"), timeout=0.1)
+
+
+class ScriptRecordingDriver(PollingDriver):
+
+    def __init__(self, recording=False):
+        super().__init__(present=lambda polls: True)
+        self.recording = recording
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+
+
+class TestHighlightModes:
+
+    # YAML reads a bare on/off override as a boolean, which the page maps back
+    @pytest.mark.parametrize("mode, recording, highlighted", [
+        ("off", True, False),
+        ("on", False, True),
+        ("recording", False, False),
+        ("recording", True, True),
+    ])
+    def test_mode_decides_whether_found_elements_are_highlighted(self, monkeypatch, mode, recording, highlighted):
+        monkeypatch.setenv('TEST_CONFIG__DEBUG__HIGHLIGHT', mode)
+        driver = ScriptRecordingDriver(recording)
+        page = polling_page(driver)
+
+        element = page.find_element(("id", "login-username"))
+        expected = [(scripts.HIGHLIGHT, (element, "background: yellow; border: 2px solid red;", 1000))]
+        assert page.highlight_mode == mode
+        assert driver.scripts == (expected if highlighted else [])
+
+
+class TestObserverWaits:
+
+    def test_one_round_trip_per_wait(self):
+        driver = ScriptedDriver("element")
+        page = BasePage(driver)
+        page.wait_mode = 'observer'
+
+        assert page.find_element(("id", "login-username")) == "element"
+        # The whole explicit wait fits in a single call
+        assert driver.calls == [("id", "login-username", "present", 10000, 100)]
+
+    def test_long_wait_split_at_the_call_limit(self, monkeypatch):
+        clock = [0.0]
+
+        class SlowDriver(ScriptedDriver):
+            # A call that times out returns None after spending its whole budget
+            def execute_async_script(self, script, *args):
+                result = super().execute_async_script(script, *args)
+                if result is None:
+                    clock[0] += args[3] / 1000
+                return result
+
+        monkeypatch.setattr(base_page, 'time', SimpleNamespace(monotonic=lambda: clock[0], sleep=time.sleep))
+        driver = SlowDriver(None, None, "element")
+        page = BasePage(driver)
+        page.wait_mode = 'observer'
+
+        assert page.observe(("id", "js-user-menu"), 'visible', timeout=25) == "element"
+        assert [call[3] for call in driver.calls] == [10000, 10000, 5000]
+
+    def test_retried_on_new_document_until_deadline(self):
+        driver = ScriptedDriver(JavascriptException("document unloaded"), None, None)
+        page = BasePage(driver)
+        page.wait_mode = 'observer'
+
+        with pytest.raises(TimeoutException):
+            page.observe(("id", "js-user-menu"), 'visible', timeout=0.2)
+        assert len(driver.calls) >= 2
+        assert driver.calls[-1][3] <= 200
+
+    def test_script_errors_are_not_retried(self):
+        driver = ScriptedDriver(JavascriptException("javascript error: Unsupported wait state: typo"))
+        page = BasePage(driver)
+        page.wait_mode = 'observer'
+
+        with pytest.raises(JavascriptException):
+            page.observe(("id", "js-user-menu"), 'typo', timeout=5)
+        assert len(driver.calls) == 1
+
+
+class NavigatingDriver(ScriptedDriver):
+
+    def __init__(self, *results):
+        super().__init__(*results)
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+def probe_results(*oks):
+    return [{'present': ok, 'visible': ok, 'enabled': ok, 'text': '', 'attributes': {}, 'ok': ok} for ok in oks]
+
+
+class TestReadinessNavigation:
+
+    def test_navigate_waits_for_the_page_readiness_locators(self):
+        driver = NavigatingDriver(probe_results(True, True, True))
+        page = LoginPage(driver)
+        page.navigate_to()
+
+        assert driver.visited == [page.url]
+        # One probe for the login form being interactive, instead of waiting for the load event
+        (specs, timeout, interval), = driver.calls
+        assert [(spec['value'], spec['state']) for spec in specs] == [
+            ("login-username", 'interactive'), ("login-password", 'interactive'), ("js-login-btn", 'interactive')
+        ]
+        assert page.explicit_wait * 1000 - 100 < timeout <= page.explicit_wait * 1000
+
+    def test_dashboard_waits_for_its_own_locators(self):
+        driver = NavigatingDriver(probe_results(True))
+        page = LoginPage(driver)
+        page.navigate_to_dashboard(timeout=5)
+
+        (specs, timeout, interval), = driver.calls
+        assert [(spec['value'], spec['state']) for spec in specs] == [("h1.dashboard-title", 'visible')]
+        assert 4900 < timeout <= 5000
+
+    def test_page_not_ready_raises_with_pending_locators(self):
+        driver = NavigatingDriver(probe_results(True, False, True))
+        page = LoginPage(driver)
+        with pytest.raises(TimeoutException, match="login-password"):
+            page.navigate_to()
+
+    def test_pages_without_readiness_locators_do_not_wait(self):
+        driver = NavigatingDriver()
+        BasePage(driver).navigate("about:blank")
+        assert driver.visited == ["about:blank"]
+        assert driver.calls == []
+
+    def test_driver_returns_at_dom_content_loaded(self, monkeypatch):
+        from selenium import webdriver
+        import conftest
+        created = []
+
+        class FakeChrome:
+            def __init__(self, options):
+                created.append(options)
+
+            def implicitly_wait(self, seconds):
+                pass
+
+            def maximize_window(self):
+                pass
+
+        monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+        conftest.create_driver(load_config())
+        # eager: navigation returns at DOMContentLoaded and the page objects wait for readiness
+        assert created[0].page_load_strategy == 'eager'
+
+
+# A minimal DOM for running the page scripts under node: elements by id or class name,
+# computed style from element.style, and a MutationObserver a scenario triggers with mutate()
+FAKE_DOM = """
+const elements = {};
+let observed = null;
+global.document = {
+    documentElement: {},
+    getElementById: (id) => elements[id] || null,
+    getElementsByClassName: (name) => Object.values(elements).filter((e) => e.className === name),
+};
+global.window = {getComputedStyle: (element) => element.style};
+global.MutationObserver = class {
+    constructor(callback) { this.callback = callback; }
+    observe() { observed = this.callback; }
+    disconnect() { observed = null; }
+};
+function add(id, display, className, props) {
+    elements[id] = Object.assign({
+        id, className, isConnected: true, disabled: false, innerText: '', attributes: {},
+        style: {display, visibility: 'visible'},
+        getBoundingClientRect: () => ({width: 10, height: 10}),
+        getAttribute(name) { return name in this.attributes ? this.attributes[name] : null; },
+    }, props || {});
+}
+function mutate() { if (observed) observed([]); }
+const args = JSON.parse(process.argv[1]);
+const started = Date.now();
+function report(result) {
+    console.log(JSON.stringify({result, ms: Date.now() - started}));
+    process.exit(0);
+}
+"""
+
+# Runs WAIT_FOR; the element(s) found are reported by id
+WAIT_FOR_HARNESS = FAKE_DOM + """
+const [by, value, state, timeout] = args;
+new Function(process.argv[2])(by, value, state, timeout, 20, (result) => {
+    report(result === null || result === true ? result :
+        Array.isArray(result) ? result.map((e) => e.id) : result.id);
+});
+%s
+"""
+
+# Sets up the scenario, then runs PROBE with args [specs, timeout]
+PROBE_HARNESS = FAKE_DOM + """
+%s
+new Function(process.argv[2])(args[0], args[1], 20, report);
+"""
+
+
+def run_script(harness, script, args, scenario=""):
+    result = subprocess.run(
+        ['node', '-e', harness % scenario, json.dumps(args), script],
+        capture_output=True, text=True, timeout=10
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def run_wait_script(args, scenario):
+    output = run_script(WAIT_FOR_HARNESS, scripts.WAIT_FOR, args, scenario)
+    return {'found': output['result'], 'ms': output['ms']}
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node is needed to run the page scripts")
+class TestWaitScript:
+
+    @pytest.mark.parametrize("state, scenario, found", [
+        ('present', "setTimeout(() => { add('menu', 'none'); mutate(); }, 30);", "menu"),
+        # A style change mutates nothing; the fallback interval notices it
+        ('visible', "add('menu', 'none'); setTimeout(() => { elements.menu.style.display = 'block'; }, 30);", "menu"),
+        ('all_present', "setTimeout(() => { add('a', 'block', 'row'); add('b', 'block', 'row'); mutate(); }, 30);",
+         ["a", "b"]),
+        ('absent', "add('menu', 'block'); setTimeout(() => { delete elements.menu; mutate(); }, 30);", True),
+        ('hidden', "add('menu', 'block'); setTimeout(() => { elements.menu.style.display = 'none'; }, 30);", True),
+    ])
+    def test_resolves_when_state_is_reached(self, state, scenario, found):
+        by = 'class name' if state == 'all_present' else 'id'
+        value = 'row' if state == 'all_present' else 'menu'
+        result = run_wait_script([by, value, state, 2000], scenario)
+        assert result['found'] == found
+        assert result['ms'] < 1000
+
+    def test_resolves_null_on_timeout(self):
+        result = run_wait_script(['id', 'menu', 'present', 100], "")
+        assert result['found'] is None
+        assert result['ms'] >= 100
+
+    def test_unsupported_state_throws(self):
+        result = subprocess.run(
+            ['node', '-e', WAIT_FOR_HARNESS % "", json.dumps(['id', 'menu', 'typo', 100]), scripts.WAIT_FOR],
+            capture_output=True, text=True, timeout=10
+        )
+        assert "Unsupported wait state: typo" in result.stderr
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node is needed to run the page scripts")
+class TestProbeScript:
+
+    @staticmethod
+    def spec(value, state, attributes=()):
+        return {'by': 'id', 'value': value, 'state': state, 'attributes': list(attributes)}
+
+    def test_reports_every_locator_in_one_call(self):
+        scenario = (
+            "add('email', 'block', '', {attributes: {type: 'email'}});"
+            "add('error', 'block', '', {innerText: ' Invalid email or password '});"
+            "add('login', 'block', '', {disabled: true});"
+            "add('menu', 'none');"
+        )
+        specs = [
+            self.spec('email', 'visible', ['type', 'placeholder']),
+            self.spec('error', 'present'),
+            self.spec('login', 'interactive'),
+            self.spec('menu', 'visible'),
+            self.spec('dashboard', 'absent'),
+        ]
+        email, error, login, menu, dashboard = run_script(PROBE_HARNESS, scripts.PROBE, [specs, 0], scenario)['result']
+
+        assert email == {'present': True, 'visible': True, 'enabled': True, 'text': '', 'ok': True,
+                         'attributes': {'type': 'email', 'placeholder': None}}
+        assert error['text'] == "Invalid email or password" and error['ok']
+        # Visible but disabled is not interactive
+        assert login['visible'] and not login['enabled'] and not login['ok']
+        assert menu['present'] and not menu['visible'] and not menu['ok']
+        assert dashboard == {'present': False, 'visible': False, 'enabled': False, 'text': None,
+                             'attributes': {}, 'ok': True}
+
+    def test_polls_until_every_state_is_reached(self):
+        scenario = (
+            "add('menu', 'none'); add('spinner', 'block');"
+            "setTimeout(() => { elements.menu.style.display = 'block'; }, 30);"
+            "setTimeout(() => { delete elements.spinner; }, 60);"
+        )
+        specs = [self.spec('menu', 'visible'), self.spec('spinner', 'absent')]
+        output = run_script(PROBE_HARNESS, scripts.PROBE, [specs, 2000], scenario)
+
+        assert [result['ok'] for result in output['result']] == [True, True]
+        assert 60 <= output['ms'] < 1000
+
+    def test_returns_the_last_snapshot_on_timeout(self):
+        output = run_script(PROBE_HARNESS, scripts.PROBE, [[self.spec('menu', 'visible')], 100])
+        assert output['result'][0]['ok'] is False
+        assert output['ms'] >= 100
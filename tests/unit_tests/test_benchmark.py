@@ -0,0 +1,33 @@
+from utils.benchmark import BenchmarkHistory, check_regression, percentile
+
+
+class TestBenchmarkHelpers:
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 0.50) == 50
+        assert percentile(samples, 0.95) == 95
+        assert percentile([7], 0.99) == 7
+
+    def test_regression_against_history(self, tmp_path):
+        history = BenchmarkHistory(str(tmp_path / 'history.jsonl'), baseline_runs=3)
+        for p95 in (10, 12, 11, 40):
+            history.append({'find_element': {'p95_ms': p95, 'round_trips': 2}})
+        baseline = history.baseline('find_element')
+        assert baseline == {'p95_ms': 12, 'round_trips': 2}
+
+        result = {'p95_ms': 14, 'round_trips': 2.4}
+        assert check_regression('find_element', result, baseline, {}, 0.25) == []
+        result = {'p95_ms': 16, 'round_trips': 3}
+        assert len(check_regression('find_element', result, baseline, {'find_element': 15}, 0.25)) == 3
+
+    def test_regressed_results_stay_out_of_the_baseline(self, tmp_path):
+        history = BenchmarkHistory(str(tmp_path / 'history.jsonl'), baseline_runs=3)
+        history.record('find_element', {'p95_ms': 10, 'round_trips': 2})
+        history.flush()
+        history.record('find_element', {'p95_ms': 40, 'round_trips': 2}, ["p95 regressed"])
+        history.flush()
+
+        assert len(history.load()) == 2
+        assert history.load()[1]['results']['find_element']['regressions'] == ["p95 regressed"]
+        assert history.baseline('find_element') == {'p95_ms': 10, 'round_trips': 2}
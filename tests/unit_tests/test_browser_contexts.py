@@ -0,0 +1,61 @@
+import pytest
+from utils.browser_contexts import BrowserContexts
+
+
+class FakeSwitchTo:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.handle = handle
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.capabilities = {'goog:chromeOptions': {'debuggerAddress': 'localhost:9222'}}
+        self.commands = []
+        self.handle = None
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        count = len(self.commands)
+        return {'browserContextId': f'context-{count}', 'targetId': f'target-{count}'}
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestBrowserContexts:
+
+    def test_scenarios_run_in_their_own_contexts(self):
+        host = FakeDriver()
+        attached = []
+
+        def attach(debugger_address):
+            assert debugger_address == 'localhost:9222'
+            attached.append(FakeDriver())
+            return attached[-1]
+
+        contexts = BrowserContexts(host, attach, max_workers=2)
+        results = contexts.run([lambda context: context.driver.handle] * 3)
+
+        assert sorted(results) == sorted(driver.handle for driver in attached)
+        assert len(set(results)) == 3
+        assert all(driver.quit_called for driver in attached)
+        assert host.commands.count('Target.createBrowserContext') == 3
+        assert host.commands.count('Target.disposeBrowserContext') == 3
+
+    def test_failed_scenario_raises_after_all_finish(self):
+        host = FakeDriver()
+        contexts = BrowserContexts(host, lambda address: FakeDriver())
+
+        def fail(context):
+            raise AssertionError("scenario failed")
+
+        with pytest.raises(AssertionError, match="scenario failed"):
+            contexts.run([fail, lambda context: True])
+        assert host.commands.count('Target.disposeBrowserContext') == 2
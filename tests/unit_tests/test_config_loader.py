@@ -0,0 +1,46 @@
+import os
+import pytest
+from utils import config_loader
+from utils.config_loader import load_config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / 'config.yaml'
+    path.write_text(
+        "browser:\n"
+        "  headless: false\n"
+        "  implicit_wait: 10\n"
+        "workers:\n"
+        "  gw1:\n"
+        "    browser:\n"
+        "      implicit_wait: 5\n"
+    )
+    yield str(path)
+    config_loader.clear_cache()
+
+
+class TestConfigLoader:
+
+    def test_parsed_once_and_immutable(self, config_file):
+        config = load_config(config_file)
+        assert load_config(config_file) is config
+        with pytest.raises(TypeError):
+            config['browser']['headless'] = True
+
+    def test_reparsed_when_mtime_changes(self, config_file, monkeypatch):
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        assert load_config(config_file)['browser']['implicit_wait'] == 10
+        with open(config_file, 'a') as file:
+            file.write("urls:\n  base_url: http://localhost\n")
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config(config_file)['urls']['base_url'] == "http://localhost"
+
+    def test_worker_and_env_overrides(self, config_file, monkeypatch):
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw1')
+        monkeypatch.setenv('TEST_CONFIG__BROWSER__HEADLESS', 'true')
+        config = load_config(config_file)
+        assert config['browser']['implicit_wait'] == 5
+        assert config['browser']['headless'] is True
+        assert 'workers' not in config
@@ -0,0 +1,65 @@
+import pytest
+from utils.db_pool import ConnectionPool
+from utils.db_utils import DatabaseUtils
+from utils.user_cache import UserCache
+
+
+@pytest.fixture
+def db_utils(tmp_path):
+    pool = ConnectionPool({'driver': 'sqlite', 'path': str(tmp_path / 'test_db.sqlite')}, size=2)
+    db_utils = DatabaseUtils(pool=pool, user_cache=UserCache())
+    db_utils.execute_query(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT NOT NULL UNIQUE, password TEXT NOT NULL)"
+    )
+    db_utils.execute_query(
+        "INSERT INTO users (email, password) VALUES (%s, %s)", ("test@example.com", "Test@123")
+    )
+    yield db_utils
+    pool.close()
+
+
+class TestDatabaseUtils:
+
+    def test_user_lookups(self, db_utils):
+        assert db_utils.verify_user_exists("test@example.com")
+        assert not db_utils.verify_user_exists("invalid@example.com")
+        assert db_utils.get_user_details("test@example.com")[1:] == ("test@example.com", "Test@123")
+
+    def test_connections_are_reused(self, db_utils):
+        for _ in range(10):
+            db_utils.fetch_all("SELECT * FROM users")
+        assert db_utils.pool._created == 1
+
+    def test_failed_write_is_rolled_back(self, db_utils):
+        with pytest.raises(Exception):
+            with db_utils.pool.transaction() as conn:
+                conn.raw.execute("DELETE FROM users")
+                raise RuntimeError("abort")
+        assert db_utils.verify_user_exists("test@example.com")
+
+    def test_prefetched_lookups_are_served_from_cache(self, db_utils):
+        db_utils.prefetch_users(["test@example.com", "invalid@example.com"])
+        db_utils.pool.close()
+        assert db_utils.verify_user_exists("test@example.com")
+        assert not db_utils.verify_user_exists("invalid@example.com")
+        assert db_utils.user_cache.stats()['hits'] == 2
+
+    def test_writes_invalidate_cache(self, db_utils):
+        assert not db_utils.verify_user_exists("new@example.com")
+        db_utils.execute_query(
+            "INSERT INTO users (email, password) VALUES (%s, %s)", ("new@example.com", "New@123")
+        )
+        assert db_utils.verify_user_exists("new@example.com")
+
+    def test_seed_and_delete_users_in_bulk(self, db_utils):
+        users = ((f"user{index}@example.com", "Secret@1") for index in range(1200))
+        assert len(db_utils.seed_users(users, batch_size=500)) == 1200
+        assert db_utils.verify_user_exists("user1199@example.com")
+        assert db_utils.delete_users([f"user{index}@example.com" for index in range(1200)]) == 1200
+        assert not db_utils.verify_user_exists("user1199@example.com")
+
+    def test_seeding_leaves_existing_users_alone(self, db_utils):
+        users = [("test@example.com", "Overwritten@1"), ("new@example.com", "New@123")]
+        assert db_utils.seed_users(users) == ["new@example.com"]
+        assert db_utils.get_user_details("test@example.com")[2] == "Test@123"
+        assert db_utils.seed_users(users) == []
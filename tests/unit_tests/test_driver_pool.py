@@ -0,0 +1,107 @@
+import threading
+from types import SimpleNamespace
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+
+    def __init__(self, name):
+        self.name = name
+        self.quit_called = False
+        self.current_url = "https://app.example.com/#/dashboard"
+        self.window_handles = ["main"]
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.visited = []
+        self.history = ["https://app.example.com/#/login", "https://sso.example.org/auth"]
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        if cmd == 'Page.getNavigationHistory':
+            return {'entries': [{'url': url} for url in self.history]}
+        return {}
+
+    def execute_script(self, script):
+        return None
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+
+    def __init__(self, gate=None):
+        self.started = []
+        self.calls = 0
+        self.gate = gate
+
+    def __call__(self):
+        self.calls += 1
+        # Only the background starts wait, so the first acquire is never blocked
+        if self.gate and self.calls > 1:
+            self.gate.wait(5)
+        driver = FakeDriver(f"driver-{len(self.started)}")
+        self.started.append(driver)
+        return driver
+
+
+class TestDriverPool:
+
+    def test_released_driver_is_reset_and_reused(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, warm_spare=False)
+        driver = pool.acquire()
+        pool.release(driver)
+
+        assert driver.visited == ['about:blank']
+        # Storage goes for every origin in the tab's history, not only the current one
+        cleared = [params['origin'] for cmd, params in driver.commands if cmd == 'Storage.clearDataForOrigin']
+        assert cleared == ["https://app.example.com", "https://sso.example.org"]
+        assert pool.acquire() is driver
+        assert len(factory.started) == 1
+
+    def test_failed_and_worn_out_drivers_are_discarded(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, max_uses=2, warm_spare=False)
+        failed = pool.acquire()
+        pool.release(failed, failed=True)
+        assert failed.quit_called
+
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        pool.release(driver)
+        assert driver.quit_called
+        assert pool.acquire() not in (failed, driver)
+
+    def test_warm_spare_is_handed_over_on_next_acquire(self):
+        factory = FakeFactory()
+        pool = DriverPool(factory, warm_spare=True)
+        first = pool.acquire()
+        pool.discard(first)
+
+        second = pool.acquire()
+        # The spare started while the first driver was in use, so no cold start was needed
+        assert second is factory.started[1]
+        pool.close()
+        # The next spare was scheduled on hand-off and is quit with the pool; the driver in use is not
+        assert [driver.quit_called for driver in factory.started] == [True, False, True]
+
+    def test_close_quits_a_spare_that_is_still_starting(self):
+        gate = threading.Event()
+        factory = FakeFactory(gate)
+        pool = DriverPool(factory, warm_spare=True)
+        in_use = pool.acquire()
+
+        closer = threading.Thread(target=pool.close)
+        closer.start()
+        assert len(factory.started) == 1
+        gate.set()
+        closer.join(5)
+
+        spare = factory.started[1]
+        assert spare.quit_called
+        assert not in_use.quit_called
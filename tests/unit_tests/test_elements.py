@@ -0,0 +1,159 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from pages.base_page import BasePage
+from pages.elements import Element
+from pages.login_page import LoginPage
+
+
+class FakeElement:
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.generation = driver.generation
+
+    @property
+    def text(self):
+        if self.generation != self.driver.generation:
+            raise StaleElementReferenceException("stale element reference")
+        return f"text {self.generation}"
+
+    def click(self):
+        pass
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.generation = 0
+        self.finds = 0
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.finds += 1
+        return FakeElement(self)
+
+    def get(self, url):
+        self.generation += 1
+
+
+class DemoPage(BasePage):
+    heading = Element("id", "heading")
+
+
+class TestElementProxy:
+
+    def test_element_cached_until_stale_or_navigation(self):
+        driver = FakeDriver()
+        page = DemoPage(driver)
+
+        assert page.get_text(page.heading) == "text 0"
+        assert page.heading.text == "text 0"
+        assert driver.finds == 1
+
+        # The view was re-rendered without a navigation; the stale reference is re-found once
+        driver.generation += 1
+        assert page.heading.text == "text 1"
+        assert driver.finds == 2
+
+        page.navigate("about:blank", ready_locators=())
+        assert page.get_text(page.heading) == "text 2"
+        assert driver.finds == 3
+
+    def test_proxies_are_per_page_instance(self):
+        driver = FakeDriver()
+        first, second = DemoPage(driver), DemoPage(driver)
+
+        assert first.heading is first.heading
+        assert first.heading is not second.heading
+        assert DemoPage.heading.locator == ("id", "heading")
+
+    def test_route_change_drops_hidden_elements(self):
+        driver = FakeDriver()
+        page = LoginPage(driver)
+        assert page.email_input.text == "text 0"
+
+        # The SPA hides the login view instead of re-rendering it, so nothing goes stale
+        page.click_forgot_password()
+        assert page.email_input.text == "text 0"
+        assert driver.finds == 3
+
+
+class RoutingElement(FakeElement):
+
+    def click(self):
+        self.driver.execute('clickElement', {})
+
+
+class RoutingDriver(FakeDriver):
+    """FakeDriver whose commands go through execute, like a remote WebDriver"""
+
+    def __init__(self):
+        super().__init__()
+        self.url = None
+        self.link = None
+        self.url_reads = 0
+
+    def execute(self, driver_command, params=None):
+        if driver_command == 'get':
+            self.url = params['url']
+        elif driver_command == 'goBack':
+            self.url = "https://app.example.com/#/login"
+        elif driver_command == 'clickElement' and self.link:
+            self.url = self.link
+        return {'value': None}
+
+    def find_element(self, by, value):
+        self.finds += 1
+        return RoutingElement(self)
+
+    def get(self, url):
+        self.execute('get', {'url': url})
+
+    def back(self):
+        self.execute('goBack')
+
+    @property
+    def current_url(self):
+        self.url_reads += 1
+        return self.url
+
+
+class TestNavigationWatch:
+
+    def test_raw_driver_navigation_drops_cached_elements(self):
+        driver = RoutingDriver()
+        page = DemoPage(driver)
+        assert page.heading.text == "text 0"
+
+        # Neither call goes through BasePage.navigate and nothing goes stale
+        driver.get("https://app.example.com/#/dashboard")
+        assert page.heading.text == "text 0"
+        assert driver.finds == 2
+        driver.back()
+        assert page.heading.text == "text 0"
+        assert driver.finds == 3
+        assert driver.url_reads == 0
+
+    def test_in_app_link_drops_cached_elements(self):
+        driver = RoutingDriver()
+        page = DemoPage(driver)
+        page.navigate("https://app.example.com/#/login", ready_locators=())
+        page.click_element(page.heading)
+        assert driver.finds == 1
+
+        # A click that keeps the route costs one URL read and keeps the cache
+        assert page.heading.text == "text 0"
+        assert (driver.finds, driver.url_reads) == (1, 1)
+
+        driver.link = "https://app.example.com/#/dashboard"
+        page.click_element(page.heading)
+        assert page.heading.text == "text 0"
+        assert (driver.finds, driver.url_reads) == (2, 2)
+
+    def test_watching_twice_wraps_execute_once(self):
+        driver = RoutingDriver()
+        DemoPage(driver)
+        execute = driver.execute
+        DemoPage(driver)
+        assert driver.execute is execute
@@ -0,0 +1,34 @@
+import pytest
+import requests
+from local_app.server import LocalLoginApp, INVALID_CREDENTIALS
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = LocalLoginApp({"test@example.com": "Test@123"}).start()
+    yield app
+    app.stop()
+
+
+class TestLocalLoginApp:
+
+    def test_serves_login_page(self, app):
+        response = requests.get(app.base_url)
+        assert response.status_code == 200
+        for element_id in ("login-username", "login-password", "js-login-btn", "js-forgot-password"):
+            assert f'id="{element_id}"' in response.text
+
+    def test_login_session_and_logout(self, app):
+        session = requests.Session()
+        response = session.post(f"{app.base_url}/api/login",
+                                json={"email": "test@example.com", "password": "Test@123"})
+        assert response.status_code == 200
+        assert session.get(f"{app.base_url}/api/session").json()["email"] == "test@example.com"
+        session.post(f"{app.base_url}/api/logout")
+        assert session.get(f"{app.base_url}/api/session").status_code == 401
+
+    def test_invalid_login(self, app):
+        response = requests.post(f"{app.base_url}/api/login",
+                                 json={"email": "invalid@example.com", "password": "Invalid@123"})
+        assert response.status_code == 401
+        assert response.json()["error"] == INVALID_CREDENTIALS
@@ -0,0 +1,47 @@
+import logging
+import os
+import threading
+import pytest
+from utils import logging_setup
+from utils.config_loader import load_config
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def isolated_logging():
+    # The suite's own listener is stopped for the test and started again afterwards
+    logging_setup.shutdown_logging()
+    yield
+    logging_setup.shutdown_logging()
+    logging_setup.configure_logging(load_config().get('logging', {}), ROOT_DIR)
+
+
+class TestLoggingSetup:
+
+    def test_records_are_written_by_the_listener_and_flushed_on_shutdown(self, tmp_path, isolated_logging):
+        listener = logging_setup.configure_logging({'path': 'logs', 'console': False, 'level': 'info'}, str(tmp_path))
+        assert logging_setup.configure_logging({}, str(tmp_path)) is listener
+        queue_handlers = [handler for handler in logging.getLogger().handlers
+                          if isinstance(handler, logging_setup.QueueHandler)]
+        assert len(queue_handlers) == 1
+
+        logger = logging.getLogger("LoginPage")
+        threads = [
+            threading.Thread(target=lambda index=index: logger.info(f"record {index}"))
+            for index in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.debug("below the configured level")
+        logging_setup.shutdown_logging()
+
+        log_file, = (tmp_path / 'logs').glob("test_*.log")
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 20
+        assert all(" - LoginPage - INFO - record " in line for line in lines)
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        assert all(f" - {worker} - " in line for line in lines)
+        assert queue_handlers[0] not in logging.getLogger().handlers
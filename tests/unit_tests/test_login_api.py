@@ -0,0 +1,39 @@
+import pytest
+from local_app.server import LocalLoginApp, INVALID_CREDENTIALS
+from pages.login_api import LoginApi, get_adapter, run_login_matrix
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = LocalLoginApp({"test@example.com": "Test@123"}).start()
+    yield app
+    app.stop()
+
+
+class TestLoginApi:
+
+    def test_login_error_and_logout(self, app):
+        api = LoginApi(app.base_url)
+        api.login("invalid@example.com", "Invalid@123")
+        assert api.get_error_message() == INVALID_CREDENTIALS
+        assert api.is_dashboard_absent()
+
+        api.login("test@example.com", "Test@123")
+        assert api.get_error_message() is None
+        assert api.is_dashboard_displayed()
+        api.logout()
+        assert api.is_logged_out()
+        api.close()
+
+    def test_matrix_runs_concurrently_on_shared_pool(self, app):
+        rows = [{'email': "test@example.com", 'password': "Test@123", 'expected': 'success', 'error': ''}]
+        rows += [
+            {'email': f"user{index}@example.com", 'password': "wrong", 'expected': 'failure',
+             'error': INVALID_CREDENTIALS}
+            for index in range(50)
+        ]
+        assert run_login_matrix(rows, max_workers=8, base_url=app.base_url) == []
+
+        pool = get_adapter().poolmanager.connection_from_url(app.base_url)
+        # Keep-alive connections are reused instead of opened per request
+        assert pool.num_connections <= 8
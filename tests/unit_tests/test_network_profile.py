@@ -0,0 +1,60 @@
+import json
+import pytest
+from utils.network_profile import NetworkProfiles, NetworkUsage
+
+
+def event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def navigation_log(blocked):
+    """Performance log of one navigation loading app.js and either loading or blocking tracker.js"""
+    log = [
+        event('Network.requestWillBeSent', requestId='1', loaderId='1', type='Document',
+              request={'url': "https://app.example.com/"}),
+        event('Network.loadingFinished', requestId='1', encodedDataLength=1000),
+        event('Network.requestWillBeSent', requestId='2', loaderId='1', type='Script',
+              request={'url': "https://cdn.example.com/tracker.js"}),
+    ]
+    if blocked:
+        log.append(event('Network.loadingFailed', requestId='2', blockedReason='inspector'))
+    else:
+        log.append(event('Network.loadingFinished', requestId='2', encodedDataLength=5000))
+    return log
+
+
+class FakeDriver:
+
+    def __init__(self, log):
+        self.log = log
+
+    def get_log(self, name):
+        return self.log
+
+
+class TestNetworkProfiles:
+
+    def test_patterns_include_extended_profiles(self):
+        profiles = NetworkProfiles({
+            'full': {'block': []},
+            'no-ads': {'block': ["*ads*"]},
+            'minimal': {'extends': 'no-ads', 'block': ["*.woff2", "*ads*"]}
+        })
+        assert profiles.patterns('minimal') == ["*ads*", "*.woff2"]
+        with pytest.raises(ValueError):
+            profiles.patterns('typo')
+
+
+class TestNetworkUsage:
+
+    def test_saved_bytes_unknown_until_the_url_loaded_unblocked(self):
+        usage = NetworkUsage()
+        blocked_first = usage.collect(FakeDriver(navigation_log(blocked=True)))[0]
+        assert blocked_first['blocked_requests'] == 1
+        assert blocked_first['saved_bytes'] is None
+
+        usage.collect(FakeDriver(navigation_log(blocked=False)))
+        blocked_later = usage.collect(FakeDriver(navigation_log(blocked=True)))[0]
+        assert blocked_later['requests'] == 1
+        assert blocked_later['bytes'] == 1000
+        assert blocked_later['saved_bytes'] == 5000
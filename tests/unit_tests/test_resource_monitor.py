@@ -0,0 +1,29 @@
+from utils.resource_monitor import ResourceMonitor
+
+
+class MetricsDriver:
+
+    def __init__(self, heap_bytes):
+        self.heap_bytes = heap_bytes
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        if command == 'Performance.getMetrics':
+            return {'metrics': [{'name': 'Nodes', 'value': 10}, {'name': 'JSHeapUsedSize', 'value': self.heap_bytes}]}
+        return {}
+
+
+class TestResourceMonitor:
+
+    def test_js_heap_sampled_and_compared(self):
+        driver = MetricsDriver(10 * 1024 * 1024)
+        monitor = ResourceMonitor(max_js_heap_mb=12)
+        before = monitor.sample(driver)
+        driver.heap_bytes = 20 * 1024 * 1024
+        after = monitor.sample(driver)
+
+        assert driver.commands.count('Performance.enable') == 1
+        assert monitor.compare(before, after)['delta']['js_heap_mb'] == 10.0
+        assert monitor.exceeded(before) == []
+        assert monitor.exceeded(after) == ["js_heap_mb 20.0 > 12"]
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+from utils.scheduling import DurationScheduling
+
+
+class FakeNode:
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indexes):
+        self.sent.extend(indexes)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class FakeHistory:
+
+    def __init__(self, durations, groups):
+        self._durations = durations
+        self._groups = groups
+
+    def durations(self, window):
+        return self._durations
+
+    def groups(self):
+        return self._groups
+
+
+class TestDurationScheduling:
+
+    def test_longest_units_first_and_groups_kept_together(self):
+        collection = ["t.py::fast", "t.py::slow", "t.py::login_a", "t.py::login_b", "t.py::new"]
+        history = FakeHistory(
+            durations={"t.py::fast": 1.0, "t.py::slow": 30.0, "t.py::login_a": 8.0, "t.py::login_b": 8.0},
+            groups={"t.py::login_a": "login_as:valid_user", "t.py::login_b": "login_as:valid_user"}
+        )
+        config = SimpleNamespace(getvalue=lambda name: ["2*popen"], hook=None)
+        scheduler = DurationScheduling(config, history=history)
+        nodes = [FakeNode("gw0"), FakeNode("gw1")]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, collection)
+
+        scheduler.schedule()
+
+        # The slowest test and the 16s login group start first, each on its own worker
+        assert [collection[index] for index in nodes[0].sent][0] == "t.py::slow"
+        assert [collection[index] for index in nodes[1].sent][:2] == ["t.py::login_a", "t.py::login_b"]
+        assert scheduler.default_duration == 8.0
+        assert sorted(index for node in nodes for index in node.sent) == list(range(len(collection)))
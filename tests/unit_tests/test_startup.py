@@ -0,0 +1,27 @@
+import json
+import time
+from utils.startup import StartupProfile
+
+
+class TestStartupProfile:
+
+    def test_phases_and_report(self, tmp_path):
+        profile = StartupProfile(time.perf_counter())
+        profile.mark('conftest_import')
+        with profile.phase('collection'):
+            time.sleep(0.01)
+        profile.collected(3)
+
+        with open(profile.write(str(tmp_path))) as file:
+            report = json.load(file)
+        assert list(report['phases']) == ['conftest_import', 'collection']
+        assert report['phases']['collection'] >= 0.01
+        assert report['items'] == 3
+        assert isinstance(report['heavy_modules_loaded'], list)
+
+    def test_page_objects_import_without_selenium_webdriver(self):
+        import subprocess
+        import sys
+        code = "import sys, pages.login_page, utils.db_utils; print('selenium.webdriver' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,41 @@
+import json
+import pytest
+from utils.test_data import shard_file
+
+
+def write_csv(path, count):
+    lines = ["email,password,expected,error"]
+    lines += [f"user{index}@example.com,pass{index},success," for index in range(count)]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def write_jsonl(path, count):
+    path.write_text("".join(json.dumps({'email': f"user{index}@example.com"}) + "\n" for index in range(count)))
+    return str(path)
+
+
+class TestShardFile:
+
+    @pytest.mark.parametrize("shards", [1, 2, 3, 4, 7, 50, 64])
+    @pytest.mark.parametrize("writer, name", [(write_csv, "rows.csv"), (write_jsonl, "rows.jsonl")])
+    def test_every_row_in_exactly_one_shard(self, tmp_path, writer, name, shards):
+        path = writer(tmp_path / name, 50)
+        data_shards = shard_file(path, shards)
+        assert 1 <= len(data_shards) <= shards
+        assert [shard.index for shard in data_shards] == list(range(len(data_shards)))
+
+        emails = [row['email'] for shard in data_shards for row in shard.rows()]
+        assert sorted(emails) == sorted(f"user{index}@example.com" for index in range(50))
+
+    def test_rows_are_read_lazily(self, tmp_path):
+        # Large enough that the last row lies well beyond the file's read buffer
+        path = write_csv(tmp_path / "rows.csv", 5000)
+        shard, = shard_file(path, 1)
+        rows = shard.rows()
+        assert next(rows)['email'] == "user0@example.com"
+
+        # Rewrite a row the generator has not reached yet; a lazy reader sees the new bytes
+        text = (tmp_path / "rows.csv").read_text()
+        (tmp_path / "rows.csv").write_text(text.replace("user4999@", "late4999@"))
+        assert list(rows)[-1]['email'] == "late4999@example.com"
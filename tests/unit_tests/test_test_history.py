@@ -0,0 +1,93 @@
+import itertools
+from types import SimpleNamespace
+import pytest
+import conftest
+from utils import test_history
+from utils.test_history import TestHistory
+
+
+def report(when, outcome='passed', duration=1.0, error="TimeoutException: Element not visible"):
+    return SimpleNamespace(
+        when=when,
+        duration=duration,
+        failed=outcome == 'failed',
+        skipped=outcome == 'skipped',
+        longrepr=SimpleNamespace(reprcrash=SimpleNamespace(message=error))
+    )
+
+
+class FakeItem:
+
+    def __init__(self, nodeid, markers=()):
+        self.nodeid = nodeid
+        self.markers = list(markers)
+
+    def get_closest_marker(self, name):
+        return next((marker for marker in self.markers if marker.name == name), None)
+
+    def add_marker(self, marker):
+        self.markers.append(marker.mark)
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    # Strictly increasing timestamps, so "the last N attempts" does not depend on clock resolution
+    clock = itertools.count(1000)
+    monkeypatch.setattr(test_history.time, 'time', lambda: float(next(clock)))
+    return TestHistory(str(tmp_path / 'history.db'), 'run-1', batch_size=1)
+
+
+def record_attempt(history, nodeid, outcome, attempt=1, duration=1.0):
+    history.record_phase(nodeid, report('setup', duration=0.5), attempt)
+    history.record_phase(nodeid, report('call', outcome, duration), attempt)
+    history.record_phase(nodeid, report('teardown', duration=0.5), attempt)
+
+
+class TestTestHistory:
+
+    def test_flaky_only_within_window(self, history):
+        for outcome in ('failed', 'passed', 'passed', 'passed'):
+            record_attempt(history, "t.py::old_failure", outcome)
+        for outcome in ('passed', 'failed', 'passed'):
+            record_attempt(history, "t.py::flaky", outcome)
+        for outcome in ('failed', 'failed'):
+            record_attempt(history, "t.py::broken", outcome)
+
+        assert history.flaky_tests(window=3) == {"t.py::flaky"}
+        assert history.flaky_tests(window=4) == {"t.py::flaky", "t.py::old_failure"}
+
+    def test_attempt_accumulates_phases(self, history):
+        record_attempt(history, "t.py::test", 'failed', duration=2.0)
+        with history._connect() as connection:
+            row = connection.execute("SELECT attempt, outcome, duration, error FROM test_runs").fetchone()
+        assert row == (1, 'failed', 3.0, "TimeoutException")
+
+    def test_rerun_summary_counts_attempts_before_the_last(self, history):
+        record_attempt(history, "t.py::rerun", 'failed', attempt=1, duration=2.0)
+        record_attempt(history, "t.py::rerun", 'failed', attempt=2, duration=3.0)
+        record_attempt(history, "t.py::rerun", 'passed', attempt=3)
+        record_attempt(history, "t.py::once", 'failed', attempt=1)
+        other_run = TestHistory(history.path, 'run-2', batch_size=1)
+        record_attempt(other_run, "t.py::rerun", 'failed', attempt=1)
+        record_attempt(other_run, "t.py::rerun", 'passed', attempt=2)
+
+        assert history.rerun_summary() == [{'nodeid': "t.py::rerun", 'reruns': 2, 'seconds': 7.0}]
+
+
+class TestRerunMarkers:
+
+    def test_only_flaky_tests_rerun_on_any_error(self, history, monkeypatch):
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        for outcome in ('failed', 'passed'):
+            record_attempt(history, "t.py::flaky", outcome)
+        config = SimpleNamespace(stash=pytest.Stash())
+        config.stash[conftest.test_history_key] = history
+        own_marker = pytest.mark.flaky(reruns=5).mark
+        items = [FakeItem("t.py::flaky"), FakeItem("t.py::stable"), FakeItem("t.py::marked", [own_marker])]
+
+        conftest.pytest_collection_modifyitems(config, items)
+
+        flaky, stable, marked = (item.get_closest_marker('flaky') for item in items)
+        assert 'only_rerun' not in flaky.kwargs
+        assert 'TimeoutException' in stable.kwargs['only_rerun']
+        assert marked is own_marker
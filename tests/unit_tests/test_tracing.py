@@ -0,0 +1,60 @@
+import json
+from pages.base_page import BasePage
+from utils.tracing import CommandTracer
+
+
+class StubDriver:
+    """Driver whose commands all go through execute, like a remote WebDriver"""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, driver_command, params=None):
+        self.executed.append(driver_command)
+        return {'value': None}
+
+    def implicitly_wait(self, seconds):
+        self.execute('setTimeouts', {'implicit': seconds * 1000})
+
+    def find_element(self, by, value):
+        self.execute('findElement', {'using': by, 'value': value})
+        return object()
+
+
+class TestCommandTracer:
+
+    def test_commands_attributed_to_test_and_page_methods(self):
+        tracer = CommandTracer()
+        driver = tracer.attach(StubDriver())
+        assert tracer.attach(driver) is driver
+        assert driver.recording
+
+        page = BasePage(driver)
+        tracer.current_test = "test_login.py::test_valid_login"
+        page.find_element(("id", "login-username"))
+
+        find = next(record for record in tracer.records if record['command'] == 'findElement')
+        assert find['test'] == "test_login.py::test_valid_login"
+        assert find['locator'] == "id=login-username"
+        assert find['method'] == "BasePage.wait_for"
+        assert find['action'] == "BasePage.find_element"
+        # Attaching twice must not wrap execute twice
+        assert len(tracer.records) == len(driver.executed)
+
+    def test_summary_and_report(self, tmp_path):
+        tracer = CommandTracer(top_n=2)
+        driver = tracer.attach(StubDriver())
+        for test in ("test_a", "test_b", "test_b"):
+            tracer.current_test = test
+            driver.find_element("id", "menu")
+
+        summary = tracer.summary()
+        assert summary['total_commands'] == 3
+        assert summary['per_test']['test_b']['calls'] == 2
+        assert summary['per_command'] == {'findElement': {'calls': 3, 'seconds': summary['total_seconds']}}
+        assert len(summary['slowest']) == 2
+
+        json_path = tracer.write_report(str(tmp_path), "profile_master")
+        with open(json_path) as file:
+            assert json.load(file)['total_commands'] == 3
+        assert "<h1>WebDriver profile</h1>" in (tmp_path / "profile_master.html").read_text()
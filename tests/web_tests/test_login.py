@@ -53,6 +53,7 @@ class TestLoginPOM:
             error_message = self.login_page.get_error_message()
             assert error_message is not None, "Error message not displayed"
             assert "Invalid email or password" in error_message, "Incorrect error message"
+            assert self.login_page.is_dashboard_absent(), "Dashboard displayed after invalid login"
 
     @allure.story("Remember Me Functionality")
     @allure.severity(allure.severity_level.MINOR)
@@ -89,4 +90,58 @@ class TestLoginPOM:
         with allure.step("Click forgot password link"):
             self.login_page.click_forgot_password()
             # Verify forgot password page is displayed
-            assert self.login_page.is_forgot_password_page_displayed(), "Forgot password page not displayed" 
\ No newline at end of file
+            assert self.login_page.is_forgot_password_page_displayed(), "Forgot password page not displayed" 
+
+    @allure.story("Restored Session")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    @pytest.mark.login_as("valid_user")
+    def test_dashboard_reload_keeps_session(self, logged_in_page):
+        """Test that an authenticated session survives loading the dashboard again"""
+        with allure.step("Reload the dashboard"):
+            # A real reload; navigating to the same #/dashboard URL would not re-check the session
+            logged_in_page.reload(LoginPage.DASHBOARD_READY_LOCATORS, 'visible')
+            assert logged_in_page.is_dashboard_displayed(), "Dashboard not displayed after reload"
+
+    @allure.story("Logout")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    @pytest.mark.login_as("valid_user")
+    def test_logout(self, logged_in_page):
+        """Test logout from an already authenticated session"""
+        with allure.step("Logout"):
+            logged_in_page.logout()
+            assert logged_in_page.is_logged_out(), "Logout failed"
+
+    @allure.story("Isolated Sessions")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    def test_concurrent_logins_are_isolated(self, browser_contexts):
+        """Test valid and invalid logins side by side in isolated browser contexts"""
+        valid_user = self.config['test_data']['valid_user']
+        invalid_user = self.config['test_data']['invalid_user']
+
+        def valid_login(context):
+            login_page = LoginPage(context.driver)
+            login_page.navigate_to()
+            login_page.login(valid_user['email'], valid_user['password'])
+            return login_page.is_dashboard_displayed()
+
+        def invalid_login(context):
+            login_page = LoginPage(context.driver)
+            login_page.navigate_to()
+            login_page.login(invalid_user['email'], invalid_user['password'])
+            # The error only shows once the login response is in; checking absence earlier passes trivially
+            error_message = login_page.get_error_message()
+            return (error_message is not None and "Invalid email or password" in error_message
+                    and login_page.is_dashboard_absent())
+
+        def fresh_session(context):
+            # Another context's login cookie must not leak into this one
+            login_page = LoginPage(context.driver)
+            login_page.navigate_to()
+            return login_page.is_login_page_displayed()
+
+        with allure.step("Run logins concurrently, one browser context each"):
+            results = browser_contexts.run([valid_login, invalid_login, valid_login, fresh_session])
+            assert results == [True, True, True, True], f"Unexpected results per context: {results}"
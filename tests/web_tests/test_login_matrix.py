@@ -0,0 +1,41 @@
+import pytest
+from pages.login_page import LoginPage
+import allure
+
+@allure.epic("VWO Login Tests")
+@allure.feature("Data-Driven Login")
+class TestLoginMatrix:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, driver, config):
+        self.driver = driver
+        self.config = config
+        self.login_page = LoginPage(driver)
+
+    @allure.story("Credential Matrix")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    def test_credential_matrix(self, credential_rows):
+        """Test every credential row of one shard of the matrix file"""
+        failures = []
+        for index, row in enumerate(credential_rows.rows()):
+            with allure.step(f"Login as '{row['email']}', expecting {row['expected']}"):
+                self.login_page.navigate_to()
+                if index:
+                    # Going to the same #/login URL keeps the previous row's notification in the DOM
+                    self.login_page.reload()
+                self.login_page.login(row['email'], row['password'])
+
+                if row['expected'] == 'success':
+                    if self.login_page.is_dashboard_displayed():
+                        self.login_page.logout()
+                    else:
+                        failures.append(f"{row['email']}: dashboard not displayed")
+                else:
+                    error_message = self.login_page.get_error_message()
+                    if not error_message or row['error'] not in error_message:
+                        failures.append(f"{row['email']}: unexpected error message {error_message!r}")
+                    elif not self.login_page.is_dashboard_absent():
+                        failures.append(f"{row['email']}: dashboard displayed after rejected login")
+
+        assert not failures, "Credential rows failed:\n" + "\n".join(failures)
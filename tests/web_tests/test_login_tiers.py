@@ -0,0 +1,61 @@
+import pytest
+from pages.login_api import run_login_matrix
+import allure
+
+BOTH_TIERS = pytest.mark.parametrize("tier", [
+    pytest.param("ui", marks=pytest.mark.tier("ui")),
+    pytest.param("api", marks=pytest.mark.tier("api")),
+])
+
+@allure.epic("VWO Login Tests")
+@allure.feature("Login Tiers")
+class TestLoginTiers:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, login_client, config):
+        self.login_client = login_client
+        self.config = config
+
+    @allure.story("Invalid Login")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    @BOTH_TIERS
+    def test_invalid_login(self, tier):
+        """Test login with invalid credentials through the browser or over HTTP"""
+        with allure.step(f"Login with invalid credentials ({tier})"):
+            self.login_client.navigate_to()
+            invalid_user = self.config['test_data']['invalid_user']
+            self.login_client.login(invalid_user['email'], invalid_user['password'])
+
+            error_message = self.login_client.get_error_message()
+            assert error_message is not None, "Error message not displayed"
+            assert "Invalid email or password" in error_message, "Incorrect error message"
+            assert self.login_client.is_dashboard_absent(), "Dashboard displayed after invalid login"
+
+    @allure.story("Valid Login")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @pytest.mark.smoke
+    @BOTH_TIERS
+    def test_valid_login(self, tier):
+        """Test login and logout with valid credentials through the browser or over HTTP"""
+        with allure.step(f"Login with valid credentials ({tier})"):
+            self.login_client.navigate_to()
+            valid_user = self.config['test_data']['valid_user']
+            self.login_client.login(valid_user['email'], valid_user['password'])
+            assert self.login_client.is_dashboard_displayed(), "Dashboard not displayed after login"
+
+        with allure.step("Logout"):
+            self.login_client.logout()
+            assert self.login_client.is_logged_out(), "Logout failed"
+
+    @allure.story("Credential Matrix")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    @pytest.mark.tier("api")
+    def test_credential_matrix(self, credential_rows):
+        """Test every credential row of one shard of the matrix file concurrently over HTTP"""
+        with allure.step(f"Check {credential_rows.id} over HTTP"):
+            failures = run_login_matrix(
+                credential_rows.rows(), self.config['api']['max_workers'], self.login_client.base_url
+            )
+            assert not failures, "Credential rows failed:\n" + "\n".join(failures)
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import threading
+import zipfile
+import logging
+import json
+import re
+import os
+
+
+class ArtifactWriter:
+    """Writes test artifacts (screenshots, page source, console logs) on background threads.
+
+    The test thread only hands over raw bytes. Compression, naming and disk I/O
+    happen on a small thread pool. ``submit`` blocks once ``max_pending_bytes``
+    are queued, so a burst of failures cannot grow memory without bound.
+    ``close`` flushes everything that is still queued.
+    """
+
+    def __init__(self, base_dir, max_workers=2, max_pending_bytes=64 * 1024 * 1024):
+        self.base_dir = base_dir
+        self.max_pending_bytes = max_pending_bytes
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='artifact-writer')
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+
+    def submit(self, name, screenshot=None, page_source=None, console_logs=None):
+        """Queue one artifact bundle; returns without touching the disk"""
+        payload = {
+            'screenshot': screenshot,
+            'page_source': page_source.encode('utf-8') if page_source is not None else None,
+            'console_logs': json.dumps(console_logs, indent=2).encode('utf-8') if console_logs else None
+        }
+        size = sum(len(data) for data in payload.values() if data)
+        with self._condition:
+            # A single bundle larger than the budget is still let through on its own
+            while self._pending_bytes and self._pending_bytes + size > self.max_pending_bytes:
+                self._condition.wait()
+            self._pending_bytes += size
+        return self._executor.submit(self._write, self._file_stem(name), payload, size)
+
+    def close(self):
+        """Wait for queued artifacts to be written and stop the workers"""
+        self._executor.shutdown(wait=True)
+        self.logger.info(f"Artifacts flushed to {self.base_dir}")
+
+    def _write(self, stem, payload, size):
+        try:
+            os.makedirs(self.base_dir, exist_ok=True)
+            path = os.path.join(self.base_dir, stem)
+            if payload['screenshot']:
+                with open(f"{path}.png", 'wb') as file:
+                    file.write(payload['screenshot'])
+                self.logger.info(f"Screenshot saved: {path}.png")
+            if payload['page_source'] or payload['console_logs']:
+                with zipfile.ZipFile(f"{path}.zip", 'w', zipfile.ZIP_DEFLATED) as bundle:
+                    if payload['page_source']:
+                        bundle.writestr('page_source.html', payload['page_source'])
+                    if payload['console_logs']:
+                        bundle.writestr('console_logs.json', payload['console_logs'])
+        except Exception as e:
+            self.logger.error(f"Failed to write artifacts for {stem}: {str(e)}")
+        finally:
+            with self._condition:
+                self._pending_bytes -= size
+                self._condition.notify_all()
+
+    @staticmethod
+    def _file_stem(name):
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')
+        return f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
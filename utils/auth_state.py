@@ -0,0 +1,114 @@
+from urllib.parse import urlparse
+from contextlib import contextmanager
+import threading
+import logging
+import json
+import time
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var entries = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        entries[key] = storage.getItem(key);
+    }
+    return entries;
+}
+return {origin: window.location.origin,
+        local_storage: dump(window.localStorage),
+        session_storage: dump(window.sessionStorage)};
+"""
+
+# Runs before any page script on the next document of the captured origin
+RESTORE_STORAGE_SCRIPT = """
+(function (state) {
+    if (window.location.origin !== state.origin) {
+        return;
+    }
+    Object.keys(state.local_storage).forEach(function (key) {
+        window.localStorage.setItem(key, state.local_storage[key]);
+    });
+    Object.keys(state.session_storage).forEach(function (key) {
+        window.sessionStorage.setItem(key, state.session_storage[key]);
+    });
+})(%s);
+"""
+
+
+class AuthStateCache:
+    """Snapshots of logged-in browser state (cookies, local and session storage), one per user.
+
+    Each xdist worker keeps its own snapshots. A snapshot is treated as expired
+    once ``ttl`` seconds have passed or any captured cookie has expired, and the
+    caller is expected to log in through the UI again and re-capture.
+    """
+
+    def __init__(self, ttl=1800):
+        self.ttl = ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_key):
+        """Return the snapshot for a user, or None when there is none or it has expired"""
+        with self._lock:
+            state = self._states.get(user_key)
+        if state and self.is_expired(state):
+            self.logger.info(f"Storage state for {user_key} expired")
+            self.discard(user_key)
+            return None
+        return state
+
+    def discard(self, user_key):
+        with self._lock:
+            self._states.pop(user_key, None)
+
+    def capture(self, driver, user_key):
+        """Snapshot the logged-in state of the driver's current page"""
+        state = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        state['cookies'] = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        state['captured_at'] = time.time()
+        with self._lock:
+            self._states[user_key] = state
+        self.logger.info(f"Captured storage state for {user_key} ({len(state['cookies'])} cookies)")
+        return state
+
+    @contextmanager
+    def inject(self, driver, state, url):
+        """Put the snapshot's cookies and storage in place for pages of url's origin loaded inside the block"""
+        parsed = urlparse(url)
+        if f"{parsed.scheme}://{parsed.netloc}" != state['origin']:
+            raise ValueError(f"Cannot restore state captured for {state['origin']} on {url}")
+        driver.execute_cdp_cmd('Network.setCookies', {
+            'cookies': [_settable_cookie(cookie) for cookie in state['cookies']]
+        })
+        storage = {key: state[key] for key in ('origin', 'local_storage', 'session_storage')}
+        script = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': RESTORE_STORAGE_SCRIPT % json.dumps(storage)
+        })
+        try:
+            yield
+        finally:
+            driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {
+                'identifier': script['identifier']
+            })
+
+    def is_expired(self, state):
+        now = time.time()
+        if now - state['captured_at'] > self.ttl:
+            return True
+        # Session cookies report expires -1
+        return any(0 < cookie.get('expires', -1) <= now for cookie in state['cookies'])
+
+
+_SETTABLE_COOKIE_FIELDS = (
+    'name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires', 'priority'
+)
+
+
+def _settable_cookie(cookie):
+    settable = {key: value for key, value in cookie.items() if key in _SETTABLE_COOKIE_FIELDS}
+    if settable.get('expires', -1) <= 0:
+        # Session cookie; an explicit non-positive expiry would delete it
+        settable.pop('expires', None)
+    return settable
@@ -0,0 +1,151 @@
+from datetime import datetime
+import subprocess
+import statistics
+import logging
+import json
+import time
+import math
+import os
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class BenchmarkRunner:
+    """Times an operation many times and counts the WebDriver round trips it makes.
+
+    Round trips are read from the CommandTracer attached to the driver, so a
+    primitive that gains an extra command shows up even when latency hides it.
+    """
+
+    def __init__(self, tracer, iterations=50, warmup=5):
+        self.tracer = tracer
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def run(self, name, operation, setup=None):
+        """Run setup (untimed) and operation (timed) for every iteration and record the stats"""
+        for _ in range(self.warmup):
+            if setup:
+                setup()
+            operation()
+
+        timings = []
+        round_trips = []
+        for _ in range(self.iterations):
+            if setup:
+                setup()
+            commands_before = len(self.tracer.records)
+            start = time.perf_counter()
+            operation()
+            timings.append((time.perf_counter() - start) * 1000)
+            round_trips.append(len(self.tracer.records) - commands_before)
+
+        result = {
+            'iterations': self.iterations,
+            'p50_ms': round(percentile(timings, 0.50), 3),
+            'p90_ms': round(percentile(timings, 0.90), 3),
+            'p95_ms': round(percentile(timings, 0.95), 3),
+            'p99_ms': round(percentile(timings, 0.99), 3),
+            'mean_ms': round(statistics.mean(timings), 3),
+            'round_trips': round(statistics.mean(round_trips), 2)
+        }
+        self.results[name] = result
+        self.logger.info(
+            f"{name}: p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, "
+            f"{result['round_trips']} round trips"
+        )
+        return result
+
+
+class BenchmarkHistory:
+    """Append-only JSONL file of benchmark runs used as the regression baseline.
+
+    Results that regressed are written with their ``regressions`` so the run
+    stays on record, but they never become part of the baseline.
+    """
+
+    def __init__(self, path, baseline_runs=5):
+        self.path = path
+        self.baseline_runs = baseline_runs
+        self.results = {}
+
+    def record(self, name, result, regressions=()):
+        """Keep a result of this run, tagged with its regressions if it has any"""
+        self.results[name] = dict(result, regressions=list(regressions)) if regressions else result
+
+    def flush(self):
+        """Append the results recorded in this run, if any"""
+        if self.results:
+            self.append(self.results)
+            self.results = {}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r') as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def baseline(self, name):
+        """Median p95 and round trips of a primitive over the last baseline_runs runs"""
+        runs = [
+            run['results'][name] for run in self.load()
+            if name in run['results'] and not run['results'][name].get('regressions')
+        ]
+        runs = runs[-self.baseline_runs:]
+        if not runs:
+            return None
+        return {
+            'p95_ms': statistics.median(run['p95_ms'] for run in runs),
+            'round_trips': statistics.median(run['round_trips'] for run in runs)
+        }
+
+    def append(self, results):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        entry = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'revision': self._revision(),
+            'worker': os.environ.get('PYTEST_XDIST_WORKER', 'master'),
+            'results': results
+        }
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+
+    @staticmethod
+    def _revision():
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except Exception:
+            return None
+
+
+def check_regression(name, result, baseline, thresholds, max_regression):
+    """Return a list of human-readable regressions of result against thresholds and baseline"""
+    problems = []
+    limit = thresholds.get(name)
+    if limit is not None and result['p95_ms'] > limit:
+        problems.append(f"{name} p95 {result['p95_ms']} ms exceeds threshold {limit} ms")
+    if baseline:
+        allowed = baseline['p95_ms'] * (1 + max_regression)
+        if result['p95_ms'] > allowed:
+            problems.append(
+                f"{name} p95 {result['p95_ms']} ms regressed past {allowed:.1f} ms "
+                f"(baseline {baseline['p95_ms']} ms)"
+            )
+        # Polling waits vary in round trips from run to run, so they get the same tolerance as p95
+        allowed_round_trips = baseline['round_trips'] * (1 + max_regression)
+        if result['round_trips'] > allowed_round_trips:
+            problems.append(
+                f"{name} makes {result['round_trips']} round trips, more than {allowed_round_trips:.2f} "
+                f"(baseline {baseline['round_trips']})"
+            )
+    return problems
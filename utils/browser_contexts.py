@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import logging
+import os
+
+
+class BrowserContext:
+    """An isolated browser context (own cookies, storage and cache) inside a shared Chrome.
+
+    ``driver`` is a WebDriver session attached to the same Chrome and switched
+    to the context's tab, so page objects use it like any other driver.
+    """
+
+    def __init__(self, context_id, target_id, driver):
+        self.context_id = context_id
+        self.target_id = target_id
+        self.driver = driver
+
+    def __repr__(self):
+        return f"BrowserContext({self.context_id})"
+
+
+class BrowserContexts:
+    """Opens isolated contexts in the host driver's Chrome and runs scenarios in them concurrently.
+
+    Contexts are created with CDP ``Target.createBrowserContext``, which costs
+    a renderer rather than a whole browser. A WebDriver session drives one tab
+    at a time, so each context gets its own session attached through Chrome's
+    debugger address; ``attach`` builds that session from the address and
+    ``on_open``, if given, prepares it once it points at the context's tab.
+    """
+
+    def __init__(self, host_driver, attach, max_workers=4, on_open=None):
+        self.host_driver = host_driver
+        self.attach = attach
+        self.on_open = on_open
+        self.max_workers = max_workers
+        self.worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._contexts = []
+        self._lock = threading.Lock()
+
+    @property
+    def debugger_address(self):
+        return self.host_driver.capabilities['goog:chromeOptions']['debuggerAddress']
+
+    def open(self, url='about:blank'):
+        """Create a context with one tab and return it with a session attached to that tab"""
+        with self._lock:
+            context_id = self.host_driver.execute_cdp_cmd('Target.createBrowserContext', {
+                'disposeOnDetach': True
+            })['browserContextId']
+            target_id = self.host_driver.execute_cdp_cmd('Target.createTarget', {
+                'url': url,
+                'browserContextId': context_id
+            })['targetId']
+
+        driver = None
+        try:
+            driver = self.attach(self.debugger_address)
+            # ChromeDriver uses the DevTools target id as the window handle
+            driver.switch_to.window(target_id)
+            if self.on_open:
+                self.on_open(driver)
+        except Exception:
+            if driver is not None:
+                driver.quit()
+            self._dispose(context_id)
+            raise
+
+        context = BrowserContext(context_id, target_id, driver)
+        with self._lock:
+            self._contexts.append(context)
+        self.logger.info(f"[{self.worker_id}] Opened {context}")
+        return context
+
+    def close_context(self, context):
+        """Detach the context's session and dispose of the context with all its tabs"""
+        with self._lock:
+            if context not in self._contexts:
+                return
+            self._contexts.remove(context)
+        try:
+            # An attached session leaves the browser it did not start running
+            context.driver.quit()
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Failed to detach from {context}: {str(e)}")
+        self._dispose(context.context_id)
+
+    def run(self, scenarios, max_workers=None):
+        """Run each scenario(context) in a fresh context from a thread pool; results keep their order.
+
+        Every scenario runs to completion; the first exception is raised afterwards.
+        """
+        def run_isolated(scenario):
+            context = self.open()
+            try:
+                return scenario(context)
+            finally:
+                self.close_context(context)
+
+        workers = min(max_workers or self.max_workers, len(scenarios)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'contexts-{self.worker_id}') as executor:
+            futures = [executor.submit(run_isolated, scenario) for scenario in scenarios]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            self.logger.error(f"[{self.worker_id}] {len(errors)} of {len(scenarios)} scenarios failed")
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Dispose of every context that is still open"""
+        with self._lock:
+            contexts = list(self._contexts)
+        for context in contexts:
+            self.close_context(context)
+
+    def _dispose(self, context_id):
+        try:
+            with self._lock:
+                self.host_driver.execute_cdp_cmd('Target.disposeBrowserContext', {
+                    'browserContextId': context_id
+                })
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Failed to dispose browser context {context_id}: {str(e)}")
@@ -0,0 +1,131 @@
+from types import MappingProxyType
+import threading
+import yaml
+import os
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
+
+# TEST_CONFIG__BROWSER__HEADLESS=true overrides browser.headless
+ENV_PREFIX = 'TEST_CONFIG__'
+
+_lock = threading.Lock()
+_parsed = {}
+_views = {}
+_runtime_overrides = {}
+_generation = 0
+
+
+def load_config(path=CONFIG_PATH):
+    """Return the configuration as a read-only mapping, parsed once per process.
+
+    The YAML file is parsed again only when its mtime changes. On top of it are
+    layered the section under ``workers.<xdist worker id>``, any
+    ``TEST_CONFIG__SECTION__KEY`` environment variables and the values set at
+    runtime with ``set_overrides``, in that order.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    env_overrides = tuple(sorted(
+        (name, value) for name, value in os.environ.items() if name.startswith(ENV_PREFIX)
+    ))
+    key = (path, mtime, worker_id, env_overrides, _generation)
+
+    view = _views.get(key)
+    if view is not None:
+        return view
+
+    with _lock:
+        view = _views.get(key)
+        if view is None:
+            config = _parse(path, mtime)
+            workers = config.pop('workers', None) or {}
+            if worker_id and worker_id in workers:
+                _merge(config, workers[worker_id])
+            for name, value in env_overrides:
+                _merge(config, _env_to_mapping(name, value))
+            _merge(config, _runtime_overrides)
+
+            for stale in [k for k in _views if k[0] == path and k[1] != mtime]:
+                del _views[stale]
+            view = _views[key] = _freeze(config)
+    return view
+
+
+def set_overrides(overrides):
+    """Layer values decided at runtime (e.g. the URL of a fixture-started server) over the config"""
+    global _generation
+    with _lock:
+        _merge(_runtime_overrides, overrides)
+        _generation += 1
+        _views.clear()
+
+
+def snapshot_overrides():
+    """Copy of the current runtime overrides, to be put back with ``restore_overrides``"""
+    with _lock:
+        return _copy(_runtime_overrides)
+
+
+def restore_overrides(snapshot):
+    """Replace the runtime overrides with a snapshot taken earlier"""
+    global _generation
+    with _lock:
+        _runtime_overrides.clear()
+        _merge(_runtime_overrides, snapshot)
+        _generation += 1
+        _views.clear()
+
+
+def clear_overrides():
+    global _generation
+    with _lock:
+        _runtime_overrides.clear()
+        _generation += 1
+        _views.clear()
+
+
+def clear_cache():
+    """Forget every parsed file and built view"""
+    with _lock:
+        _parsed.clear()
+        _views.clear()
+
+
+def _parse(path, mtime):
+    cached = _parsed.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, 'r') as file:
+            cached = _parsed[path] = (mtime, yaml.safe_load(file) or {})
+    return _copy(cached[1])
+
+
+def _env_to_mapping(name, value):
+    keys = name[len(ENV_PREFIX):].lower().split('__')
+    mapping = yaml.safe_load(value) if value else value
+    for key in reversed(keys):
+        mapping = {key: mapping}
+    return mapping
+
+
+def _merge(base, overrides):
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = _copy(value)
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -0,0 +1,224 @@
+from contextlib import contextmanager
+import threading
+import logging
+import queue
+import time
+
+
+class PooledConnection:
+    """A pooled DB-API connection with per-connection statement caching"""
+
+    def __init__(self, raw, driver):
+        self.raw = raw
+        self.driver = driver
+        self.last_used = time.monotonic()
+        self._statements = {}
+
+    def cursor_for(self, query):
+        """Return a cursor for the query, reusing the prepared statement when possible"""
+        if self.driver == 'sqlite':
+            # sqlite3 keeps its own compiled-statement cache per connection
+            return self.raw.cursor(), self._translate(query)
+        cursor = self._statements.get(query)
+        if cursor is None:
+            cursor = self._statements[query] = self.raw.cursor(prepared=True)
+        return cursor, query
+
+    def bulk_cursor(self, query):
+        """Return a plain cursor for executemany, which MySQL rewrites into multi-row statements"""
+        if self.driver == 'sqlite':
+            return self.raw.cursor(), self._translate(query)
+        return self.raw.cursor(), query
+
+    def close(self):
+        for cursor in self._statements.values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self._statements.clear()
+        self.raw.close()
+
+    @staticmethod
+    def _translate(query):
+        # Queries are written with the MySQL %s paramstyle
+        return query.replace('%s', '?')
+
+
+class ConnectionPool:
+    """Thread-safe pool of autocommit connections shared by every DatabaseUtils in the process.
+
+    Reads run directly on an autocommit connection, with no commit round trip.
+    Writes go through ``transaction`` and commit once. A connection that has
+    been idle for longer than ``health_check_interval`` seconds is pinged
+    before it is handed out and replaced if the ping fails.
+    """
+
+    def __init__(self, db_config, size=5, health_check_interval=30, borrow_timeout=30):
+        self.db_config = dict(db_config)
+        self.driver = self.db_config.get('driver', 'mysql')
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.borrow_timeout = borrow_timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the block"""
+        conn = self._borrow()
+        try:
+            yield conn
+        except Exception:
+            self._discard_if_broken(conn)
+            raise
+        else:
+            self._return(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection and run the block inside one transaction"""
+        with self.connection() as conn:
+            if self.driver == 'sqlite':
+                conn.raw.execute('BEGIN')
+            else:
+                conn.raw.start_transaction()
+            try:
+                yield conn
+            except Exception:
+                conn.raw.rollback()
+                raise
+            conn.raw.commit()
+
+    def close(self):
+        """Close every idle connection and refuse new borrows"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close(conn)
+
+    def _borrow(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._create_or_wait()
+                if conn is None:
+                    continue
+                return conn
+            if self._is_healthy(conn):
+                return conn
+            self._close(conn)
+
+    def _create_or_wait(self):
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            conn = self._idle.get(timeout=self.borrow_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No database connection available after {self.borrow_timeout}s")
+        return conn if self._is_healthy(conn) else self._close(conn)
+
+    def _connect(self):
+        # Drivers are imported when the first connection is opened, not at collection
+        if self.driver == 'sqlite':
+            import sqlite3
+            raw = sqlite3.connect(
+                self.db_config.get('path', ':memory:'),
+                isolation_level=None,
+                check_same_thread=False
+            )
+        else:
+            import mysql.connector
+            raw = mysql.connector.connect(
+                host=self.db_config['host'],
+                port=self.db_config['port'],
+                database=self.db_config['database'],
+                user=self.db_config['user'],
+                password=self.db_config['password'],
+                autocommit=True
+            )
+        self.logger.info(f"Opened {self.driver} connection ({self._created}/{self.size})")
+        return PooledConnection(raw, self.driver)
+
+    def _is_healthy(self, conn):
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        try:
+            if self.driver == 'sqlite':
+                conn.raw.execute('SELECT 1').fetchone()
+            else:
+                conn.raw.ping(reconnect=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Dropping unhealthy connection: {str(e)}")
+            return False
+
+    def _return(self, conn):
+        conn.last_used = time.monotonic()
+        if self._closed:
+            self._close(conn)
+        else:
+            self._idle.put(conn)
+
+    def _discard_if_broken(self, conn):
+        conn.last_used = 0
+        if self._is_healthy(conn):
+            self._return(conn)
+        else:
+            self._close(conn)
+
+    def _close(self, conn):
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except Exception as e:
+            self.logger.error(f"Failed to close connection: {str(e)}")
+        return None
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_config):
+    """Return the process-wide pool for this database configuration"""
+    key = tuple(sorted((k, v) for k, v in db_config.items() if not isinstance(v, dict)))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = ConnectionPool(
+                db_config,
+                size=db_config.get('pool_size', 5),
+                health_check_interval=db_config.get('health_check_interval', 30)
+            )
+        return pool
+
+
+def close_pools():
+    """Close every pool created by get_pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,87 +1,91 @@
-import mysql.connector
-import yaml
-import os
+from utils.config_loader import load_config
+from utils.db_pool import get_pool
+from utils.user_cache import get_user_cache, MISSING
+import itertools
 import logging
 
 class DatabaseUtils:
-    def __init__(self):
-        self.connection = None
-        self.cursor = None
+    PREFETCH_BATCH_SIZE = 100
+
+    def __init__(self, pool=None, user_cache=None):
         self.load_config()
         self.setup_logging()
+        self.pool = pool or get_pool(self.db_config)
+        self.user_cache = user_cache or get_user_cache(self.db_config.get('user_cache_ttl', 300))
 
     def load_config(self):
         """Load database configuration from config.yaml"""
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-            self.db_config = config['database']
+        self.db_config = load_config()['database']
 
     def setup_logging(self):
-        """Setup logging configuration"""
+        """Get the class logger; handlers are configured once per process"""
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
 
     def connect(self):
-        """Establish database connection"""
+        """Make sure the shared connection pool can hand out a connection"""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.db_config['host'],
-                port=self.db_config['port'],
-                database=self.db_config['database'],
-                user=self.db_config['user'],
-                password=self.db_config['password']
-            )
-            self.cursor = self.connection.cursor()
+            with self.pool.connection():
+                pass
             self.logger.info("Successfully connected to database")
         except Exception as e:
             self.logger.error(f"Failed to connect to database: {str(e)}")
             raise e
 
     def disconnect(self):
-        """Close database connection"""
+        """Release this instance; pooled connections stay open for the session"""
+        self.logger.info("Successfully disconnected from database")
+
+    def execute_query(self, query, params=None, invalidate_cache=True):
+        """Execute SQL write query in a transaction and return the affected row count"""
         try:
-            if self.cursor:
-                self.cursor.close()
-            if self.connection:
-                self.connection.close()
-            self.logger.info("Successfully disconnected from database")
+            with self.pool.transaction() as conn:
+                cursor, query = conn.cursor_for(query)
+                cursor.execute(query, params or ())
+                rowcount = cursor.rowcount
+            if invalidate_cache:
+                self.user_cache.invalidate()
+            return rowcount
         except Exception as e:
-            self.logger.error(f"Failed to disconnect from database: {str(e)}")
+            self.logger.error(f"Failed to execute query: {str(e)}")
             raise e
 
-    def execute_query(self, query, params=None):
-        """Execute SQL query"""
+    def execute_many(self, query, rows, batch_size=500, invalidate_cache=True):
+        """Execute SQL write query for many parameter rows in batches inside one transaction"""
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
-            
-            self.cursor.execute(query, params or ())
-            self.connection.commit()
-            return self.cursor
+            total = 0
+            with self.pool.transaction() as conn:
+                cursor, query = conn.bulk_cursor(query)
+                batch = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        cursor.executemany(query, batch)
+                        total += len(batch)
+                        batch = []
+                if batch:
+                    cursor.executemany(query, batch)
+                    total += len(batch)
+                cursor.close()
+            if invalidate_cache:
+                self.user_cache.invalidate()
+            return total
         except Exception as e:
-            self.logger.error(f"Failed to execute query: {str(e)}")
+            self.logger.error(f"Failed to execute batched query: {str(e)}")
             raise e
 
     def fetch_one(self, query, params=None):
         """Fetch single row from query result"""
         try:
-            cursor = self.execute_query(query, params)
-            return cursor.fetchone()
+            rows = self.fetch_all(query, params)
+            return rows[0] if rows else None
         except Exception as e:
             self.logger.error(f"Failed to fetch one row: {str(e)}")
             raise e
 
     def fetch_all(self, query, params=None):
-        """Fetch all rows from query result"""
+        """Fetch all rows from query result without committing"""
         try:
-            cursor = self.execute_query(query, params)
-            return cursor.fetchall()
+            return self._fetch(query, params)[1]
         except Exception as e:
             self.logger.error(f"Failed to fetch all rows: {str(e)}")
             raise e
@@ -89,18 +93,108 @@ class DatabaseUtils:
     def verify_user_exists(self, email):
         """Verify if user exists in database"""
         try:
-            query = "SELECT * FROM users WHERE email = %s"
-            result = self.fetch_one(query, (email,))
-            return result is not None
+            return self.get_user_details(email) is not None
         except Exception as e:
             self.logger.error(f"Failed to verify user existence: {str(e)}")
             raise e
 
     def get_user_details(self, email):
-        """Get user details from database"""
+        """Get user details from the cache, falling back to the database"""
         try:
+            row = self.user_cache.get(email)
+            if row is not MISSING:
+                return row
             query = "SELECT * FROM users WHERE email = %s"
-            return self.fetch_one(query, (email,))
+            row = self.fetch_one(query, (email,))
+            self.user_cache.put(email, row)
+            return row
         except Exception as e:
             self.logger.error(f"Failed to get user details: {str(e)}")
-            raise e 
\ No newline at end of file
+            raise e
+
+    def prefetch_users(self, emails):
+        """Load the given users into the cache with as few IN (...) queries as possible"""
+        try:
+            emails = list(dict.fromkeys(emails))
+            rows_by_email = dict.fromkeys(emails)
+            for start in range(0, len(emails), self.PREFETCH_BATCH_SIZE):
+                batch = emails[start:start + self.PREFETCH_BATCH_SIZE]
+                # Pad to a fixed width so every batch reuses one prepared statement
+                batch += [batch[-1]] * (self.PREFETCH_BATCH_SIZE - len(batch))
+                placeholders = ', '.join(['%s'] * len(batch))
+                columns, rows = self._fetch(f"SELECT * FROM users WHERE email IN ({placeholders})", batch)
+                email_index = columns.index('email')
+                for row in rows:
+                    rows_by_email[row[email_index]] = row
+            self.user_cache.put_many(rows_by_email)
+            self.logger.info(f"Prefetched {len(emails)} users into cache")
+        except Exception as e:
+            self.logger.error(f"Failed to prefetch users: {str(e)}")
+            raise e
+
+    def seed_users(self, users, batch_size=500):
+        """Insert (email, password) pairs that do not exist yet, in batches inside one transaction.
+
+        Existing users keep their password. Returns the emails that were
+        inserted, which are the only ones a cleanup may delete.
+        """
+        if self.pool.driver == 'sqlite':
+            insert = "INSERT INTO users (email, password) VALUES (%s, %s) ON CONFLICT(email) DO NOTHING"
+        else:
+            insert = "INSERT IGNORE INTO users (email, password) VALUES (%s, %s)"
+        users = iter(users)
+        inserted = []
+        try:
+            with self.pool.transaction() as conn:
+                while True:
+                    batch = dict(itertools.islice(users, batch_size))
+                    if not batch:
+                        break
+                    placeholders = ', '.join(['%s'] * len(batch))
+                    cursor, query = conn.bulk_cursor(f"SELECT email FROM users WHERE email IN ({placeholders})")
+                    cursor.execute(query, list(batch))
+                    existing = {row[0] for row in cursor.fetchall()}
+                    cursor.close()
+                    new_users = [(email, password) for email, password in batch.items() if email not in existing]
+                    if new_users:
+                        cursor, query = conn.bulk_cursor(insert)
+                        cursor.executemany(query, new_users)
+                        cursor.close()
+                        inserted.extend(email for email, _ in new_users)
+            self.user_cache.invalidate()
+            self.logger.info(f"Seeded {len(inserted)} users")
+            return inserted
+        except Exception as e:
+            self.logger.error(f"Failed to seed users: {str(e)}")
+            raise e
+
+    def delete_users(self, emails, batch_size=500):
+        """Delete users by email with batched IN (...) statements inside one transaction"""
+        emails = list(emails)
+        try:
+            deleted = 0
+            with self.pool.transaction() as conn:
+                for start in range(0, len(emails), batch_size):
+                    batch = emails[start:start + batch_size]
+                    placeholders = ', '.join(['%s'] * len(batch))
+                    cursor, query = conn.bulk_cursor(f"DELETE FROM users WHERE email IN ({placeholders})")
+                    cursor.execute(query, batch)
+                    deleted += cursor.rowcount
+                    cursor.close()
+            self.user_cache.invalidate()
+            self.logger.info(f"Deleted {deleted} users")
+            return deleted
+        except Exception as e:
+            self.logger.error(f"Failed to delete users: {str(e)}")
+            raise e
+
+    def invalidate_user_cache(self, email=None):
+        """Drop cached users after writes made outside execute_query"""
+        self.user_cache.invalidate(email)
+
+    def _fetch(self, query, params=None):
+        with self.pool.connection() as conn:
+            cursor, query = conn.cursor_for(query)
+            cursor.execute(query, params or ())
+            rows = cursor.fetchall()
+            return [column[0] for column in cursor.description], rows
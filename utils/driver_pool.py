@@ -0,0 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import threading
+import logging
+import os
+
+
+class DriverPool:
+    """Keeps browser instances alive across tests and hands them out one at a time.
+
+    Every process (and therefore every xdist worker) owns its own pool. A driver
+    is reset to a blank state when it is released and recycled after
+    ``max_uses`` tests or after a failed test. When ``warm_spare`` is enabled a
+    replacement browser is started in the background while the current test
+    runs, so the next ``acquire`` does not pay for a cold start.
+    """
+
+    def __init__(self, factory, max_uses=20, warm_spare=True):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.warm_spare = warm_spare
+        self.worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._spare = None
+        self._executor = None
+        if warm_spare:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f'driver-pool-{self.worker_id}'
+            )
+
+    def acquire(self):
+        """Return a ready driver, preferring idle and warm instances over a cold start"""
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            spare, self._spare = self._spare, None
+
+        if driver is None and spare is not None:
+            driver, spare = self._take_spare(spare), None
+        if driver is None:
+            driver = self._start()
+
+        with self._lock:
+            if spare is not None:
+                self._spare = spare
+            self._schedule_spare()
+        return driver
+
+    def release(self, driver, failed=False):
+        """Return a driver to the pool, recycling it when it is worn out or tainted"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if failed:
+            self.logger.info(f"[{self.worker_id}] Recycling driver after failed test")
+            self.discard(driver)
+            return
+        if self.max_uses and uses >= self.max_uses:
+            self.logger.info(f"[{self.worker_id}] Recycling driver after {uses} tests")
+            self.discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Failed to reset driver, recycling: {str(e)}")
+            self.discard(driver)
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+
+    def reset(self, driver):
+        """Bring a driver back to a blank state: one tab, no cookies or storage, about:blank"""
+        handles = driver.window_handles
+        origins = set()
+        # Every origin a tab navigated to may hold storage, not only the one it is on now
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origins.update(self._visited_origins(driver))
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+
+        origin = self._origin(driver.current_url)
+        if origin:
+            # Clears the live page's storage objects too, which CDP leaves in place until reload
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        for visited in sorted(origins | ({origin} if origin else set())):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': visited,
+                'storageTypes': 'local_storage,session_storage,indexeddb,service_workers,cache_storage'
+            })
+        driver.get('about:blank')
+        driver.execute_cdp_cmd('Page.resetNavigationHistory', {})
+
+    def discard(self, driver):
+        """Quit a driver and forget about it"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Failed to quit Chrome driver: {str(e)}")
+
+    def close(self):
+        """Quit every driver owned by the pool, including a spare that is still starting"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            spare, self._spare = self._spare, None
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        if spare is not None:
+            driver = self._take_spare(spare)
+            if driver is not None:
+                idle.append(driver)
+        for driver in idle:
+            self.discard(driver)
+
+    def _start(self):
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _schedule_spare(self):
+        if self._executor and self._spare is None and not self._idle:
+            self._spare = self._executor.submit(self._start)
+
+    def _take_spare(self, future):
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Warm spare failed to start: {str(e)}")
+            return None
+
+    def _visited_origins(self, driver):
+        try:
+            history = driver.execute_cdp_cmd('Page.getNavigationHistory', {})
+        except Exception as e:
+            self.logger.error(f"[{self.worker_id}] Failed to read navigation history: {str(e)}")
+            return set()
+        return {origin for origin in (self._origin(entry['url']) for entry in history['entries']) if origin}
+
+    @staticmethod
+    def _origin(url):
+        parsed = urlparse(url or '')
+        if parsed.scheme in ('http', 'https'):
+            return f"{parsed.scheme}://{parsed.netloc}"
+        return None
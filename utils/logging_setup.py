@@ -0,0 +1,76 @@
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime
+import threading
+import logging
+import atexit
+import queue
+import os
+
+LOG_FORMAT = '%(asctime)s - %(worker)s - %(name)s - %(levelname)s - %(message)s'
+
+_lock = threading.Lock()
+_listener = None
+_queue_handler = None
+
+
+class _WorkerFilter(logging.Filter):
+    def __init__(self, worker_id):
+        super().__init__()
+        self.worker_id = worker_id
+
+    def filter(self, record):
+        record.worker = self.worker_id
+        return True
+
+
+def configure_logging(log_config, base_dir):
+    """Install one QueueHandler on the root logger, drained by a background QueueListener.
+
+    Runs once per process, so every xdist worker gets its own
+    ``test_<worker>_<timestamp>.log``. Loggers only enqueue records; formatting,
+    console and file I/O happen on the listener thread.
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        log_dir = os.path.join(base_dir, log_config.get('path', 'reports/logs'))
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(
+            log_dir, f"test_{worker_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        )
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = [logging.FileHandler(log_file)]
+        if log_config.get('console', True):
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _queue_handler.addFilter(_WorkerFilter(worker_id))
+
+        root = logging.getLogger()
+        root.setLevel(str(log_config.get('level', 'INFO')).upper())
+        root.addHandler(_queue_handler)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+            _queue_handler = None
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
@@ -0,0 +1,45 @@
+# Commands that load another document, and commands after which an in-app link may have changed the route
+NAVIGATION_COMMANDS = frozenset({'get', 'goBack', 'goForward', 'refresh', 'switchToWindow'})
+INTERACTION_COMMANDS = frozenset({'clickElement', 'sendKeysToElement', 'actions'})
+
+
+def watch_navigation(driver):
+    """Drop cached elements however the driver navigates; watching twice is a no-op.
+
+    Wraps ``driver.execute`` like ``CommandTracer.attach``. Navigation commands
+    bump the driver's navigation counter straight away. After a click or key
+    press the next element lookup reads ``current_url`` once and bumps the
+    counter if the route changed, which covers in-app links.
+    """
+    if getattr(driver, '_navigation_watched', False) or not hasattr(driver, 'execute'):
+        return driver
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        try:
+            return original(driver_command, params)
+        finally:
+            if driver_command in NAVIGATION_COMMANDS:
+                driver._navigation_id = getattr(driver, '_navigation_id', 0) + 1
+                if driver_command == 'get':
+                    driver._route = (params or {}).get('url')
+                elif driver_command != 'refresh':
+                    driver._route = None
+            elif driver_command in INTERACTION_COMMANDS:
+                driver._route_unverified = True
+
+    driver.execute = execute
+    driver._navigation_watched = True
+    return driver
+
+
+def navigation_id(driver):
+    """The driver's navigation counter, bumped first if the URL changed since the last click or key press"""
+    if getattr(driver, '_route_unverified', False):
+        driver._route_unverified = False
+        url = driver.current_url
+        # An unknown route, e.g. after back(), counts as changed
+        if url != getattr(driver, '_route', None):
+            driver._route = url
+            driver._navigation_id = getattr(driver, '_navigation_id', 0) + 1
+    return getattr(driver, '_navigation_id', 0)
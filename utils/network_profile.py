@@ -0,0 +1,88 @@
+import threading
+import logging
+import json
+
+
+class NetworkProfiles:
+    """Named request-blocking profiles applied to Chrome through CDP Network.setBlockedURLs.
+
+    A profile is ``{'block': [url patterns], 'extends': other profile}``; the
+    patterns use the CDP wildcard syntax (``*`` matches any run of characters).
+    """
+
+    def __init__(self, profiles, default='full'):
+        self.profiles = profiles
+        self.default = default
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def patterns(self, name):
+        """Blocked URL patterns of a profile, including the ones it extends"""
+        if name not in self.profiles:
+            raise ValueError(f"Unknown network profile: {name}")
+        profile = self.profiles[name] or {}
+        patterns = list(self.patterns(profile['extends'])) if profile.get('extends') else []
+        for pattern in profile.get('block', ()):
+            if pattern not in patterns:
+                patterns.append(pattern)
+        return patterns
+
+    def apply(self, driver, name=None):
+        """Block the profile's URLs in the driver; a no-op when it is already active"""
+        name = name or self.default
+        if getattr(driver, '_network_profile', None) == name:
+            return
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns(name)})
+        driver._network_profile = name
+        self.logger.info(f"Network profile '{name}' applied")
+
+
+class NetworkUsage:
+    """Turns Chrome performance-log events into per-navigation request and byte counts.
+
+    Blocked requests never download, so the bytes they save are estimated from
+    the sizes of the same URLs seen loading earlier in the session, e.g. under
+    the 'full' profile. ``saved_bytes`` stays None while no blocked URL has a
+    known size, which is the case when the URLs were blocked from the start.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._known_sizes = {}
+        self._lock = threading.Lock()
+
+    def collect(self, driver):
+        """Drain the driver's performance log and return one summary per navigation"""
+        navigations = []
+        requests = {}
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                if params.get('type') == 'Document' and params.get('requestId') == params.get('loaderId'):
+                    navigations.append({
+                        'url': params['request']['url'],
+                        'requests': 0,
+                        'bytes': 0,
+                        'blocked_requests': 0,
+                        'saved_bytes': None
+                    })
+                requests[params['requestId']] = (params['request']['url'], navigations[-1] if navigations else None)
+            elif method == 'Network.loadingFinished':
+                url, navigation = requests.get(params.get('requestId'), (None, None))
+                size = int(params.get('encodedDataLength', 0))
+                if url:
+                    with self._lock:
+                        self._known_sizes[url] = size
+                if navigation:
+                    navigation['requests'] += 1
+                    navigation['bytes'] += size
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                url, navigation = requests.get(params.get('requestId'), (None, None))
+                if navigation:
+                    navigation['blocked_requests'] += 1
+                    with self._lock:
+                        size = self._known_sizes.get(url)
+                    if size is not None:
+                        navigation['saved_bytes'] = (navigation['saved_bytes'] or 0) + size
+        return navigations
@@ -0,0 +1,87 @@
+import logging
+
+MB = 1024 * 1024
+
+
+class ResourceMonitor:
+    """Samples what a browser costs: RSS and CPU time of its process tree and the page's JS heap.
+
+    Process figures come from psutil (an optional dependency) for the processes
+    started under the driver's chromedriver; without psutil only the JS heap is
+    sampled. The JS heap comes from CDP ``Performance.getMetrics``. Limits are
+    checked against a sample to decide when a long-lived browser should be
+    recycled.
+    """
+
+    def __init__(self, max_rss_mb=None, max_js_heap_mb=None, max_cpu_seconds=None):
+        self.limits = {
+            'rss_mb': max_rss_mb,
+            'js_heap_mb': max_js_heap_mb,
+            'cpu_seconds': max_cpu_seconds
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._psutil_missing_logged = False
+
+    def sample(self, driver):
+        """Return {rss_mb, cpu_seconds, processes, js_heap_mb}; unavailable figures are None"""
+        sample = {'rss_mb': None, 'cpu_seconds': None, 'processes': None, 'js_heap_mb': None}
+        sample.update(self._process_tree(driver))
+        try:
+            if not getattr(driver, '_performance_metrics_enabled', False):
+                driver.execute_cdp_cmd('Performance.enable', {})
+                driver._performance_metrics_enabled = True
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+            heap = next((metric['value'] for metric in metrics if metric['name'] == 'JSHeapUsedSize'), None)
+            sample['js_heap_mb'] = round(heap / MB, 1) if heap is not None else None
+        except Exception as e:
+            self.logger.error(f"Failed to read JS heap metrics: {str(e)}")
+        return sample
+
+    def compare(self, before, after):
+        """Before and after samples with the change of every figure both of them have"""
+        delta = {
+            key: round(after[key] - before[key], 2)
+            for key in ('rss_mb', 'cpu_seconds', 'js_heap_mb')
+            if before.get(key) is not None and after.get(key) is not None
+        }
+        return {'before': before, 'after': after, 'delta': delta}
+
+    def exceeded(self, sample):
+        """Descriptions of the configured limits the sample is over"""
+        return [
+            f"{key} {sample[key]} > {limit}"
+            for key, limit in self.limits.items()
+            if limit is not None and sample.get(key) is not None and sample[key] > limit
+        ]
+
+    def _process_tree(self, driver):
+        try:
+            import psutil
+        except ImportError:
+            if not self._psutil_missing_logged:
+                self.logger.info("psutil is not installed, sampling the JS heap only")
+                self._psutil_missing_logged = True
+            return {}
+
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        if process is None:
+            return {}
+        rss = cpu = 0
+        count = 0
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.Error as e:
+            self.logger.error(f"Failed to list browser processes: {str(e)}")
+            return {}
+        for child in children:
+            try:
+                with child.oneshot():
+                    rss += child.memory_info().rss
+                    times = child.cpu_times()
+                    cpu += times.user + times.system
+                count += 1
+            except psutil.Error:
+                # Renderers come and go between listing and sampling
+                continue
+        return {'rss_mb': round(rss / MB, 1), 'cpu_seconds': round(cpu, 2), 'processes': count}
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from xdist.scheduler import LoadScopeScheduling
+import statistics
+
+
+def fixture_group(item):
+    """Key of the expensive per-worker fixture state a test shares with others, or None.
+
+    Tests marked ``xdist_group``, tests logging in as the same ``login_as`` user
+    (whose captured session lives in the worker's AuthStateCache) and tests
+    seeding the same credential shard are kept on one worker.
+    """
+    marker = item.get_closest_marker('xdist_group')
+    if marker:
+        return f"group:{marker.kwargs.get('name', marker.args[0] if marker.args else 'default')}"
+    marker = item.get_closest_marker('login_as')
+    if marker and 'logged_in_page' in item.fixturenames:
+        return f"login_as:{marker.args[0]}"
+    callspec = getattr(item, 'callspec', None)
+    if callspec and 'credential_shard' in callspec.params:
+        return f"seed:{callspec.params['credential_shard'].id}"
+    return None
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """xdist scheduler handing out work longest-first, from recorded test durations.
+
+    Each test is its own work unit unless it shares a fixture group (see
+    ``fixture_group``), in which case the whole group goes to one worker.
+    Units are queued by their expected total duration, slowest first, so the
+    long browser tests start early and short ones fill the gaps at the end.
+    Tests without history are assumed to take the median recorded duration.
+
+    Durations and groups are read from the TestHistory once every worker has
+    collected, since the groups are recorded during collection.
+    """
+
+    def __init__(self, config, log=None, history=None, window=10, default_duration=1.0):
+        super().__init__(config, log)
+        self.history = history
+        self.window = window
+        self.durations = {}
+        self.groups = {}
+        self.default_duration = default_duration
+
+    def load_history(self):
+        if self.history is None:
+            return
+        self.durations = self.history.durations(self.window)
+        self.groups = self.history.groups()
+        if self.durations:
+            self.default_duration = statistics.median(self.durations.values())
+
+    def expected_duration(self, nodeid):
+        return self.durations.get(nodeid, self.default_duration)
+
+    def _split_scope(self, nodeid):
+        return self.groups.get(nodeid, nodeid)
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        self.load_history()
+        units = OrderedDict()
+        for nodeid in self.collection:
+            units.setdefault(self._split_scope(nodeid), OrderedDict())[nodeid] = False
+        for scope, work_unit in sorted(
+            units.items(), key=lambda unit: -sum(self.expected_duration(nodeid) for nodeid in unit[1])
+        ):
+            self.workqueue[scope] = work_unit
+
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _assigned = self.assigned_work.popitem(last=True)
+            self.log(f"Shutting down unused node {unused_node}")
+            unused_node.shutdown()
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
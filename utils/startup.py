@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+import time
+import json
+import sys
+import os
+
+# Dependencies that should only be imported once a fixture needs them
+HEAVY_MODULES = (
+    'selenium.webdriver',
+    'webdriver_manager',
+    'mysql.connector',
+    'requests',
+    'psutil',
+    'xdist.scheduler',
+)
+
+
+class StartupProfile:
+    """Wall-clock cost of getting a pytest process, or an xdist worker, to its first test.
+
+    Phases are recorded as ``mark`` (time since the previous mark) or with the
+    ``phase`` context manager, and the report lists which heavy dependencies
+    had been imported by the end of collection.
+    """
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        self.phases = {}
+        self.items = None
+        self.heavy_modules_loaded = None
+        self._last_mark = self.started
+
+    def mark(self, name):
+        """Record the time since the previous mark (or the start) as phase ``name``"""
+        now = time.perf_counter()
+        self.phases[name] = now - self._last_mark
+        self._last_mark = now
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+            self._last_mark = time.perf_counter()
+
+    def collected(self, items):
+        """Record the number of collected items and the heavy modules imported so far"""
+        self.items = items
+        self.heavy_modules_loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    def summary(self):
+        return {
+            'worker': self.worker_id,
+            'phases': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            'items': self.items,
+            'heavy_modules_loaded': self.heavy_modules_loaded or [],
+        }
+
+    def write(self, directory):
+        """Write the summary to startup_<worker>.json and return its path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"startup_{self.worker_id}.json")
+        with open(path, 'w') as file:
+            json.dump(self.summary(), file, indent=2)
+        return path
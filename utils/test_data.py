@@ -0,0 +1,70 @@
+import json
+import csv
+import io
+import os
+
+
+class DataShard:
+    """A byte range of a CSV or JSONL data file whose rows are parsed lazily.
+
+    Shards are cut at line boundaries from file offsets alone, so collecting
+    them costs a few seeks, every xdist worker derives the same shards, and a
+    worker only ever reads the byte ranges of the shards it runs.
+    """
+
+    def __init__(self, path, index, start, end):
+        self.path = path
+        self.index = index
+        self.start = start
+        self.end = end
+
+    @property
+    def id(self):
+        return f"{os.path.basename(self.path)}-shard{self.index}"
+
+    def rows(self):
+        """Yield the shard's rows as dicts, reading one line at a time"""
+        is_csv = self.path.endswith('.csv')
+        with open(self.path, 'rb') as file:
+            header = next(csv.reader([file.readline().decode('utf-8')])) if is_csv else None
+            file.seek(self.start)
+            while file.tell() < self.end:
+                line = file.readline()
+                if not line:
+                    break
+                text = line.decode('utf-8').strip()
+                if not text:
+                    continue
+                if is_csv:
+                    yield dict(zip(header, next(csv.reader(io.StringIO(text)))))
+                else:
+                    yield json.loads(text)
+
+    def __repr__(self):
+        return f"DataShard({self.id}, bytes {self.start}-{self.end})"
+
+
+def shard_file(path, shards):
+    """Split a data file into at most ``shards`` line-aligned byte ranges, skipping a CSV header"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as file:
+        if path.endswith('.csv'):
+            file.readline()
+        data_start = file.tell()
+        boundaries = [data_start]
+        step = max((size - data_start) // max(shards, 1), 1)
+        for index in range(1, shards):
+            target = data_start + index * step
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            position = file.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [
+        DataShard(path, index, start, end)
+        for index, (start, end) in enumerate(zip(boundaries, boundaries[1:]))
+        if end > start
+    ]
@@ -0,0 +1,181 @@
+import threading
+import logging
+import sqlite3
+import time
+import os
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_runs_nodeid ON test_runs (nodeid, created_at);
+CREATE INDEX IF NOT EXISTS idx_test_runs_run_id ON test_runs (run_id);
+CREATE TABLE IF NOT EXISTS test_groups (
+    nodeid TEXT PRIMARY KEY,
+    group_key TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class TestHistory:
+    """Local SQLite history of test attempts: outcome, duration and error per attempt.
+
+    Attempts are buffered in memory and written in batches, so recording a
+    result costs no I/O on the test path. Several xdist workers can share one
+    database file.
+    """
+
+    __test__ = False
+
+    def __init__(self, path, run_id, worker_id='master', batch_size=50):
+        self.path = path
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._pending = []
+        self._attempts = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+
+    def record_phase(self, nodeid, report, attempt=1):
+        """Accumulate a setup/call/teardown report; the attempt is stored after teardown"""
+        with self._lock:
+            current = self._attempts.setdefault(nodeid, {'outcome': 'passed', 'duration': 0.0, 'error': None})
+            current['duration'] += report.duration
+            if report.failed:
+                current['outcome'] = 'failed'
+                current['error'] = _error_type(report)
+            elif report.skipped and current['outcome'] == 'passed':
+                current['outcome'] = 'skipped'
+            if report.when != 'teardown':
+                return
+            del self._attempts[nodeid]
+            self._pending.append((
+                self.run_id, nodeid, self.worker_id, attempt, current['outcome'],
+                current['duration'], current['error'], time.time()
+            ))
+            flush = len(self._pending) >= self.batch_size
+        if flush:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO test_runs (run_id, nodeid, worker, attempt, outcome, duration, error, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def flaky_tests(self, window=20):
+        """Tests that both passed and failed within their last ``window`` attempts"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT nodeid FROM (
+                    SELECT nodeid, outcome,
+                           ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY created_at DESC) AS position
+                    FROM test_runs
+                ) WHERE position <= ?
+                GROUP BY nodeid
+                HAVING SUM(outcome = 'failed') > 0 AND SUM(outcome = 'passed') > 0
+                """,
+                (window,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def rerun_summary(self, run_id=None):
+        """Attempts that were followed by another attempt in the same run, and the time they cost"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT runs.nodeid, COUNT(*), SUM(runs.duration)
+                FROM test_runs AS runs
+                JOIN (SELECT nodeid, MAX(attempt) AS last_attempt
+                      FROM test_runs WHERE run_id = ? GROUP BY nodeid) AS last
+                  ON last.nodeid = runs.nodeid
+                WHERE runs.run_id = ? AND runs.attempt < last.last_attempt
+                GROUP BY runs.nodeid
+                ORDER BY SUM(runs.duration) DESC
+                """,
+                (run_id or self.run_id, run_id or self.run_id)
+            ).fetchall()
+        return [{'nodeid': nodeid, 'reruns': count, 'seconds': seconds} for nodeid, count, seconds in rows]
+
+    def durations(self, window=10):
+        """Average duration of each test over its last ``window`` passed or failed attempts"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT nodeid, AVG(duration) FROM (
+                    SELECT nodeid, duration,
+                           ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY created_at DESC) AS position
+                    FROM test_runs WHERE outcome IN ('passed', 'failed')
+                ) WHERE position <= ?
+                GROUP BY nodeid
+                """,
+                (window,)
+            ).fetchall()
+        return dict(rows)
+
+    def record_groups(self, groups):
+        """Store the shared-fixture group of each test, replacing the previous collection's"""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("DELETE FROM test_groups")
+            connection.executemany(
+                "INSERT INTO test_groups (nodeid, group_key, updated_at) VALUES (?, ?, ?)",
+                [(nodeid, group_key, now) for nodeid, group_key in groups.items()]
+            )
+
+    def groups(self):
+        """Shared-fixture group of each test, as recorded at the last collection"""
+        with self._connect() as connection:
+            return dict(connection.execute("SELECT nodeid, group_key FROM test_groups").fetchall())
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        return _Transaction(connection)
+
+
+class _Transaction:
+    """Commit (or roll back) and close the connection when the block ends"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+        finally:
+            self.connection.close()
+
+
+def _error_type(report):
+    try:
+        message = report.longrepr.reprcrash.message
+    except AttributeError:
+        message = str(report.longrepr)
+    return message.split(':', 1)[0][:200]
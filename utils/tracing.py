@@ -0,0 +1,157 @@
+from collections import defaultdict
+import threading
+import logging
+import html
+import json
+import time
+import sys
+import os
+
+PAGE_MODULE_PREFIX = 'pages.'
+
+
+class CommandTracer:
+    """Records every WebDriver command with its duration and the page-object method that issued it.
+
+    ``attach`` wraps ``driver.execute``, which every WebDriver and WebElement
+    command goes through. Each record carries the innermost page method (the
+    primitive, e.g. BasePage.wait_for) and the outermost one (the action, e.g.
+    LoginPage.login), so time can be broken down per test and per page method.
+    """
+
+    def __init__(self, top_n=20):
+        self.top_n = top_n
+        self.current_test = None
+        self.records = []
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+    def attach(self, driver):
+        """Start tracing a driver; attaching twice is a no-op"""
+        if getattr(driver, '_command_tracer', None) is self:
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = execute
+        driver._command_tracer = self
+        # Lets debug.highlight: recording highlight elements while a trace is captured
+        driver.recording = True
+        return driver
+
+    def summary(self):
+        """Aggregate the records per test, per page method and per command"""
+        with self._lock:
+            records = list(self.records)
+        return {
+            'total_commands': len(records),
+            'total_seconds': round(sum(record['duration'] for record in records), 6),
+            'per_test': self._aggregate(records, 'test'),
+            'per_action': self._aggregate(records, 'action'),
+            'per_method': self._aggregate(records, 'method'),
+            'per_command': self._aggregate(records, 'command'),
+            'slowest': sorted(records, key=lambda record: record['duration'], reverse=True)[:self.top_n]
+        }
+
+    def write_report(self, directory, name):
+        """Write <name>.json and <name>.html profiles and log the slowest calls"""
+        os.makedirs(directory, exist_ok=True)
+        summary = self.summary()
+        json_path = os.path.join(directory, f"{name}.json")
+        with open(json_path, 'w') as file:
+            json.dump(summary, file, indent=2)
+        with open(os.path.join(directory, f"{name}.html"), 'w') as file:
+            file.write(self._render_html(summary))
+
+        self.logger.info(
+            f"Traced {summary['total_commands']} WebDriver commands "
+            f"({summary['total_seconds']:.2f}s), profile written to {json_path}"
+        )
+        for record in summary['slowest']:
+            self.logger.info(
+                f"{record['duration'] * 1000:8.1f} ms  {record['command']:<24} "
+                f"{record['locator'] or '':<40} {record['method'] or '-'}  [{record['test']}]"
+            )
+        return json_path
+
+    def _record(self, command, params, duration):
+        locator = None
+        if params and 'using' in params and 'value' in params:
+            locator = f"{params['using']}={params['value']}"
+        method, action = self._page_methods()
+        with self._lock:
+            self.records.append({
+                'test': self.current_test,
+                'command': command,
+                'locator': locator,
+                'method': method,
+                'action': action,
+                'duration': duration
+            })
+
+    @staticmethod
+    def _page_methods():
+        innermost = outermost = None
+        frame = sys._getframe(3)
+        while frame is not None:
+            if frame.f_globals.get('__name__', '').startswith(PAGE_MODULE_PREFIX):
+                owner = frame.f_locals.get('self')
+                name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None \
+                    else frame.f_code.co_name
+                if innermost is None:
+                    innermost = name
+                outermost = name
+            frame = frame.f_back
+        return innermost, outermost
+
+    @staticmethod
+    def _aggregate(records, key):
+        totals = defaultdict(lambda: {'calls': 0, 'seconds': 0.0})
+        for record in records:
+            bucket = totals[record[key] or '-']
+            bucket['calls'] += 1
+            bucket['seconds'] += record['duration']
+        return dict(sorted(
+            ((name, {'calls': value['calls'], 'seconds': round(value['seconds'], 6)})
+             for name, value in totals.items()),
+            key=lambda item: item[1]['seconds'],
+            reverse=True
+        ))
+
+    @staticmethod
+    def _render_html(summary):
+        def table(title, rows):
+            body = ''.join(
+                f"<tr><td>{html.escape(str(name))}</td><td>{value['calls']}</td>"
+                f"<td>{value['seconds'] * 1000:.1f}</td></tr>"
+                for name, value in rows.items()
+            )
+            return (f"<h2>{title}</h2><table><tr><th>Name</th><th>Calls</th><th>Total ms</th></tr>"
+                    f"{body}</table>")
+
+        slowest = ''.join(
+            f"<tr><td>{record['duration'] * 1000:.1f}</td><td>{html.escape(record['command'])}</td>"
+            f"<td>{html.escape(record['locator'] or '')}</td><td>{html.escape(record['method'] or '-')}</td>"
+            f"<td>{html.escape(record['test'] or '-')}</td></tr>"
+            for record in summary['slowest']
+        )
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>WebDriver profile</title>"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin-bottom:24px}"
+            "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style></head><body>"
+            f"<h1>WebDriver profile</h1><p>{summary['total_commands']} commands, "
+            f"{summary['total_seconds']:.2f}s</p>"
+            "<h2>Slowest calls</h2><table><tr><th>ms</th><th>Command</th><th>Locator</th>"
+            f"<th>Method</th><th>Test</th></tr>{slowest}</table>"
+            + table("Per test", summary['per_test'])
+            + table("Per page-object action", summary['per_action'])
+            + table("Per page-object method", summary['per_method'])
+            + table("Per command", summary['per_command'])
+            + "</body></html>"
+        )
@@ -0,0 +1,64 @@
+import threading
+import time
+
+MISSING = object()
+
+
+class UserCache:
+    """In-memory user rows keyed by email with a time-to-live and hit/miss counters.
+
+    A cached ``None`` records that the user does not exist, so negative lookups
+    are served from memory as well.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._rows = {}
+        self._lock = threading.Lock()
+
+    def get(self, email, default=MISSING):
+        """Return the cached row for email, or default when missing or expired"""
+        with self._lock:
+            entry = self._rows.get(email)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return default
+
+    def put(self, email, row):
+        with self._lock:
+            self._rows[email] = (time.monotonic(), row)
+
+    def put_many(self, rows_by_email):
+        now = time.monotonic()
+        with self._lock:
+            for email, row in rows_by_email.items():
+                self._rows[email] = (now, row)
+
+    def invalidate(self, email=None):
+        """Drop one email, or every entry when no email is given"""
+        with self._lock:
+            if email is None:
+                self._rows.clear()
+            else:
+                self._rows.pop(email, None)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._rows)}
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_user_cache(ttl=300):
+    """Return the process-wide user cache"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = UserCache(ttl)
+        return _shared